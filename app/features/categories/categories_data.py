@@ -4,6 +4,7 @@
 
 from app.shared.keyboards.categories import (
     get_astrology_menu_keyboard,
+    get_category_description_text,
     get_numerology_menu_keyboard,
     get_practices_menu_keyboard,
     get_profile_menu_keyboard,
@@ -17,3 +18,9 @@ CATEGORY_HANDLERS = {
     "📊 Профиль": ("category:profile", get_profile_menu_keyboard),
 }
 
+
+# Готовые экраны категорий: текст кнопки -> (описание, клавиатура подменю)
+CATEGORY_SCREENS = {
+    category_text: (get_category_description_text(category_text), keyboard_func())
+    for category_text, (_, keyboard_func) in CATEGORY_HANDLERS.items()
+}
@@ -7,24 +7,20 @@ from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
-from app.features.categories.categories_data import CATEGORY_HANDLERS
+from app.features.categories.categories_data import CATEGORY_SCREENS
 from app.shared.decorators import catch_errors
-from app.shared.keyboards.categories import get_category_description_text
 from app.shared.messages import MessagesData
 
 router = Router()
 
 
-@router.message(F.text.in_(CATEGORY_HANDLERS.keys()), StateFilter("*"))
+@router.message(F.text.in_(CATEGORY_SCREENS.keys()), StateFilter("*"))
 @catch_errors()
 async def category_menu_handler(message: Message, state: FSMContext):
     """Обработчик выбора категории из главного меню."""
     await state.clear()
-    category_text = message.text
-    _, keyboard_func = CATEGORY_HANDLERS[category_text]
-    description = get_category_description_text(category_text)
-    
-    await message.answer(description, reply_markup=keyboard_func())
+    description, keyboard = CATEGORY_SCREENS[message.text]
+    await message.answer(description, reply_markup=keyboard)
 
 
 @router.message(F.text == "↩️ В главное меню", StateFilter("*"))
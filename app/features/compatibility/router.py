@@ -4,7 +4,7 @@ from aiogram import F, Router, types
 from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 
-from app.shared.calculations import calculate_life_path_number, validate_date
+from app.shared.calculations import parse_and_life_path
 from app.shared.decorators import catch_errors
 from app.shared.helpers import (
     check_base_achievements,
@@ -19,13 +19,24 @@ from app.shared.storage import user_storage
 
 router = Router()
 
+# Оценка и описание по разнице чисел судьбы; разница 5 и больше (в т.ч. с мастер-числами
+# 11/22/33) сводится к последнему элементу
+_COMPATIBILITY_BY_DIFF: tuple[tuple[int, str], ...] = (
+    (9, "Идеальная совместимость! Вы очень похожи по характеру."),
+    (7, "Хорошая совместимость. Вы дополняете друг друга."),
+    (7, "Хорошая совместимость. Вы дополняете друг друга."),
+    (5, "Средняя совместимость. Требуется понимание и компромиссы."),
+    (5, "Средняя совместимость. Требуется понимание и компромиссы."),
+    (3, "Низкая совместимость. Потребуется много усилий."),
+)
+
 
 @router.message(F.text == TextCommandsData.COMPATIBILITY, StateFilter("*"))
 @catch_errors()
 async def compatibility_command(message: types.Message, state: FSMContext):
     await state.clear()
     await message.answer(
-        "Введите первую дату рождения (ДД.ММ.ГГГГ):",
+        MessagesData.COMPATIBILITY_FIRST_DATE_PROMPT,
         reply_markup=get_back_to_main_keyboard(),
     )
     await state.set_state(UserStates.waiting_for_first_date)
@@ -35,13 +46,15 @@ async def compatibility_command(message: types.Message, state: FSMContext):
 @catch_errors()
 async def handle_first_date(message: types.Message, state: FSMContext):
     first_date = message.text.strip()
-    if not validate_date(first_date):
+    first_number = parse_and_life_path(first_date)
+    if first_number is None:
         await message.answer(MessagesData.ERROR_INVALID_DATE)
         return
 
-    await state.update_data(first_date=first_date)
+    # Число уже посчитано при проверке — сохраняем его, чтобы не разбирать дату повторно
+    await state.update_data(first_date=first_date, first_number=first_number)
     await message.answer(
-        "Введите вторую дату рождения (ДД.ММ.ГГГГ):",
+        MessagesData.COMPATIBILITY_SECOND_DATE_PROMPT,
         reply_markup=get_back_to_main_keyboard(),
     )
     await state.set_state(UserStates.waiting_for_second_date)
@@ -51,10 +64,25 @@ async def handle_first_date(message: types.Message, state: FSMContext):
 @catch_errors()
 async def handle_second_date(message: types.Message, state: FSMContext):
     second_date = message.text.strip()
-    if not validate_date(second_date):
+    second_number = parse_and_life_path(second_date)
+    if second_number is None:
         await message.answer(MessagesData.ERROR_INVALID_DATE)
         return
 
+    data = await state.get_data()
+    first_number = data.get("first_number")
+    if first_number is None:
+        # Состояние без сохраненного числа (старые данные FSM) — берем его из даты
+        first_number = parse_and_life_path(data.get("first_date"))
+    if first_number is None:
+        # Первой даты нет — начинаем проверку заново, а не считаем с нулем
+        await message.answer(
+            MessagesData.COMPATIBILITY_FIRST_DATE_PROMPT,
+            reply_markup=get_back_to_main_keyboard(),
+        )
+        await state.set_state(UserStates.waiting_for_first_date)
+        return
+
     user_id = message.from_user.id
 
     if not user_storage.can_check_compatibility(user_id):
@@ -65,23 +93,15 @@ async def handle_second_date(message: types.Message, state: FSMContext):
         await state.clear()
         return
 
-    data = await state.get_data()
-    first_date = data.get("first_date")
-    first_number = calculate_life_path_number(first_date)
-    second_number = calculate_life_path_number(second_date)
-
-    score = 3
-    description = "Низкая совместимость. Потребуется много усилий."
-    diff = abs(first_number - second_number)
-    if diff == 0:
-        score, description = 9, "Идеальная совместимость! Вы очень похожи по характеру."
-    elif diff <= 2:
-        score, description = 7, "Хорошая совместимость. Вы дополняете друг друга."
-    elif diff <= 4:
-        score, description = 5, "Средняя совместимость. Требуется понимание и компромиссы."
-
-    result_text = (
-        f"💑 СОВМЕСТИМОСТЬ: {first_number} и {second_number}\nОценка: {score}/9\n{description}"
+    score, description = _COMPATIBILITY_BY_DIFF[
+        min(abs(first_number - second_number), len(_COMPATIBILITY_BY_DIFF) - 1)
+    ]
+
+    result_text = MessagesData.COMPATIBILITY_RESULT.format(
+        first_number=first_number,
+        second_number=second_number,
+        score=score,
+        description=description,
     )
     
     # Обновляем стрик и проверяем достижения
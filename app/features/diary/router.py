@@ -10,7 +10,6 @@ from aiogram.types import CallbackQuery, Message
 
 from app.features.diary.diary_data import CATEGORY_LABELS
 from app.shared.decorators import catch_errors
-from app.shared.formatters import format_datetime_iso
 from app.shared.helpers import (
     check_base_achievements,
     check_daily_challenge_completion,
@@ -144,21 +143,15 @@ async def handle_diary_observation(message: Message, state: FSMContext):
         return
 
     sanitized_text = security_validator.sanitize_text(observation_text)
-    user_data = user_storage.get_user(user_id)
     data = await state.get_data()
     category = data.get("diary_category") or "Без темы"
 
-    if "diary_observations" not in user_data:
-        user_data["diary_observations"] = []
-
-    observation = {
-        "text": sanitized_text,
-        "date": format_datetime_iso(),
-        "number": user_data.get("life_path_number", "неизвестно"),
-        "category": category,
-    }
-    user_data["diary_observations"].append(observation)
-    user_storage._save_data()
+    observation = user_storage.add_diary_observation(
+        user_id,
+        sanitized_text,
+        user_storage.get_user(user_id).get("life_path_number", "неизвестно"),
+        category,
+    )
     
     # Обновляем стрик и статистику
     streak = update_user_activity(user_id, "diary")
@@ -167,11 +160,8 @@ async def handle_diary_observation(message: Message, state: FSMContext):
     unlocked_base = check_base_achievements(user_id)
     unlocked = unlocked_streak + unlocked_base
 
-    result_text = (
-        f"📝 Наблюдение сохранено!\n"
-        f"Ваше число судьбы: {observation['number']}\n"
-        f"Тема: {category}\n"
-        f"Дата: {observation['date']}"
+    result_text = DiaryMessages.SAVED.format(
+        number=observation["number"], category=category, date=observation["date"]
     )
     await message.answer(result_text, reply_markup=get_diary_result_keyboard())
     
@@ -213,10 +203,9 @@ async def handle_diary_observation(message: Message, state: FSMContext):
 
 @router.callback_query(F.data == "diary_history:last3")
 @catch_errors()
-async def diary_history_handler(callback_query: CallbackQuery):
+async def diary_history_handler(callback_query: CallbackQuery, user_data: dict | None):
     await callback_query.answer()
-    user_id = callback_query.from_user.id
-    user_data = user_storage.get_user(user_id)
+    user_data = user_data or {}
     entries = user_data.get("diary_observations", [])
     is_premium = user_data.get("subscription", {}).get("active", False)
 
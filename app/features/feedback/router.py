@@ -1,28 +1,38 @@
 """Обратная связь."""
 
-from aiogram import F, Router, types
+import asyncio
+import logging
+
+from aiogram import Bot, F, Router, types
 from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
 
+from app.settings import config
 from app.shared.decorators import catch_errors
 from app.shared.keyboards import get_back_to_main_keyboard, get_feedback_keyboard
 from app.shared.messages import CallbackData, CommandsData, MessagesData, TextCommandsData
 from app.shared.security import security_validator
 from app.shared.state import UserStates
 
+logger = logging.getLogger(__name__)
+
 router = Router()
 
+# Ссылки на фоновые пересылки: без них задачу может собрать GC до завершения
+_pending_feedback: set[asyncio.Task] = set()
+
 
-@router.callback_query(
-    F.data.in_(
-        [
-            CallbackData.FEEDBACK,
-            CallbackData.SUGGESTION,
-            CallbackData.REPORT_BUG,
-            CallbackData.LEAVE_FEEDBACK,
-        ]
-    )
+_FEEDBACK_CALLBACKS = frozenset(
+    {
+        CallbackData.FEEDBACK,
+        CallbackData.SUGGESTION,
+        CallbackData.REPORT_BUG,
+        CallbackData.LEAVE_FEEDBACK,
+    }
 )
+
+
+@router.callback_query(F.data.in_(_FEEDBACK_CALLBACKS))
 async def feedback_handler(callback_query: types.CallbackQuery, state: FSMContext):
     await callback_query.answer()
     await callback_query.message.edit_text(MessagesData.FEEDBACK_CB)
@@ -64,3 +74,34 @@ async def handle_feedback(message: types.Message, state: FSMContext):
     await message.answer(MessagesData.FEEDBACK_SUCCESS, reply_markup=get_feedback_keyboard())
     await state.clear()
 
+    # Пересылка администраторам идет в фоне — благодарность не ждет их отправки
+    feedback_text = message.text or message.caption
+    if feedback_text:
+        task = asyncio.create_task(_persist_feedback(message.bot, user_id, feedback_text))
+        _pending_feedback.add(task)
+        task.add_done_callback(_pending_feedback.discard)
+
+
+async def wait_pending_feedback(timeout: float = 10.0):
+    """
+    Дожидается фоновых пересылок отзывов при остановке бота;
+    не успевшие за timeout секунд отменяются
+    """
+    if not _pending_feedback:
+        return
+    _, pending = await asyncio.wait(set(_pending_feedback), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning("Отменено неотправленных отзывов: %s", len(pending))
+
+
+async def _persist_feedback(bot: Bot, user_id: int, feedback_text: str):
+    logger.info("Отзыв от пользователя %s, %s символов", user_id, len(feedback_text))
+    notification = MessagesData.FEEDBACK_ADMIN_NOTIFICATION.format(user_id=user_id, text=feedback_text)
+    for admin_id in config.ADMIN_USER_IDS:
+        try:
+            await bot.send_message(admin_id, notification)
+        except Exception as e:
+            logger.warning("Не удалось отправить отзыв администратору %s: %s", admin_id, e)
+
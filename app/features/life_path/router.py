@@ -5,7 +5,7 @@ from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, Message
 
-from app.shared.calculations import calculate_life_path_number, calculate_soul_number, validate_date
+from app.shared.calculations import calculate_soul_number, parse_and_life_path
 from app.shared.decorators import catch_errors
 from app.shared.helpers import (
     check_base_achievements,
@@ -91,6 +91,7 @@ async def process_life_path_number(message: Message, state: FSMContext, bot: Bot
 
 
 @router.callback_query(F.data == CallbackData.LIFE_PATH_NUMBER)
+@catch_errors()
 async def life_path_callback(callback_query: CallbackQuery, state: FSMContext):
     await callback_query.answer()
     user_id = callback_query.from_user.id
@@ -123,6 +124,7 @@ async def life_path_command(message: Message, state: FSMContext, bot: Bot):
 
 
 @router.callback_query(F.data == CallbackData.LIFE_PATH_NUMBER_AGAIN)
+@catch_errors()
 async def life_path_again(callback: CallbackQuery, state: FSMContext, bot: Bot):
     await callback.answer()
     await process_life_path_number(callback.message, state, bot)
@@ -134,7 +136,8 @@ async def handle_birth_date(message: Message, state: FSMContext):
     user_id = message.from_user.id
     birth_date = message.text.strip()
 
-    if not validate_date(birth_date):
+    computed_life_path = parse_and_life_path(birth_date)
+    if computed_life_path is None:
         await message.answer(MessagesData.ERROR_INVALID_DATE)
         return
 
@@ -158,7 +161,7 @@ async def handle_birth_date(message: Message, state: FSMContext):
         return
 
     user_storage.set_birth_date(user_id, birth_date)
-    life_path = calculate_life_path_number(birth_date)
+    life_path = computed_life_path
     soul_number = calculate_soul_number(birth_date)
     text = get_text(life_path, "life_path", user_id)
     user_storage.save_daily_result(user_id, birth_date, life_path, soul_number, text)
@@ -169,7 +172,9 @@ async def handle_birth_date(message: Message, state: FSMContext):
     unlocked_base = check_base_achievements(user_id)
     unlocked = unlocked_streak + unlocked_base
 
-    result_text = f"🔮 ВАШЕ ЧИСЛО СУДЬБЫ: {life_path}\n{text}\n📅 Дата: {birth_date}"
+    result_text = MessagesData.LIFE_PATH_RESULT_SHORT.format(
+        life_path=life_path, text=text, birth_date=birth_date
+    )
     await message.answer(result_text, reply_markup=get_result_keyboard())
     
     # Показываем достижения, если разблокированы
@@ -1,55 +1,41 @@
 """Премиум-заглушки."""
 
+from typing import Callable
+
 from aiogram import F, Router
-from aiogram.filters import Command
-from aiogram.types import CallbackQuery, Message
+from aiogram.filters import Command, StateFilter
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 
+from app.shared.decorators import catch_errors
 from app.shared.keyboards import get_back_to_main_keyboard, get_premium_info_keyboard
 from app.shared.messages import CallbackData, CommandsData, MessagesData, TextCommandsData
 
 router = Router()
 
 
-@router.callback_query(F.data.in_([CallbackData.PREMIUM_FULL, CallbackData.PREMIUM_COMPATIBILITY]))
-async def premium_handler(callback_query: CallbackQuery):
-    await callback_query.answer()
-    data = callback_query.data.upper()
-    await callback_query.message.edit_text(
-        MessagesData[data],
-        reply_markup=get_back_to_main_keyboard(),
-    )
-
-
-@router.callback_query(F.data == CallbackData.PREMIUM_INFO)
-async def premium_info_handler(callback_query: CallbackQuery):
-    await callback_query.answer()
-    await callback_query.message.edit_text(
-        MessagesData.PREMIUM_INFO_TEXT,
-        reply_markup=get_premium_info_keyboard(),
-    )
-
-
-@router.callback_query(F.data == CallbackData.PREMIUM_FEATURES)
-async def premium_features_handler(callback_query: CallbackQuery):
-    await callback_query.answer()
-    await callback_query.message.edit_text(
-        MessagesData.PREMIUM_INFO_TEXT,
-        reply_markup=get_premium_info_keyboard(),
-    )
+# Статичные экраны Premium: callback_data -> (текст, фабрика клавиатуры)
+_STATIC_SCREENS: dict[str, tuple[str, Callable[[], InlineKeyboardMarkup]]] = {
+    CallbackData.PREMIUM_FULL: (MessagesData.PREMIUM_FULL, get_back_to_main_keyboard),
+    CallbackData.PREMIUM_COMPATIBILITY: (MessagesData.PREMIUM_COMPATIBILITY, get_back_to_main_keyboard),
+    CallbackData.PREMIUM_INFO: (MessagesData.PREMIUM_INFO_TEXT, get_premium_info_keyboard),
+    CallbackData.PREMIUM_FEATURES: (MessagesData.PREMIUM_INFO_TEXT, get_premium_info_keyboard),
+    CallbackData.SUBSCRIBE: (MessagesData.PREMIUM_SOON, get_back_to_main_keyboard),
+}
 
 
-@router.callback_query(F.data == CallbackData.SUBSCRIBE)
-async def subscribe_handler(callback_query: CallbackQuery):
+@router.callback_query(F.data.in_(_STATIC_SCREENS.keys()))
+async def premium_screen_handler(callback_query: CallbackQuery):
     await callback_query.answer()
-    await callback_query.message.edit_text(
-        MessagesData.PREMIUM_SOON,
-        reply_markup=get_back_to_main_keyboard(),
-    )
+    text, keyboard_factory = _STATIC_SCREENS[callback_query.data]
+    await callback_query.message.edit_text(text, reply_markup=keyboard_factory())
 
 
-@router.message(Command(CommandsData.PREMIUM_INFO))
-@router.message(F.text == TextCommandsData.PREMIUM)
-async def premium_info_message(message: Message):
+@router.message(Command(CommandsData.PREMIUM_INFO), StateFilter("*"))
+@router.message(F.text == TextCommandsData.PREMIUM, StateFilter("*"))
+@catch_errors()
+async def premium_info_message(message: Message, state: FSMContext):
+    await state.clear()
     await message.answer(
         MessagesData.PREMIUM_INFO_TEXT,
         reply_markup=get_premium_info_keyboard(),
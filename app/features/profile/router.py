@@ -1,7 +1,7 @@
 """Профиль пользователя."""
 
 from aiogram import F, Router
-from aiogram.filters import Command, StateFilter
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 
@@ -9,14 +9,9 @@ from app.settings import config
 from app.shared.decorators import catch_errors
 from app.shared.formatters import format_iso_to_display
 from app.shared.helpers import build_extended_stats_text, is_premium
-from app.shared.keyboards import (
-    get_back_to_main_keyboard,
-    get_premium_info_keyboard,
-    get_profile_keyboard,
-)
+from app.shared.keyboards import get_back_to_main_keyboard, get_profile_keyboard
 from app.shared.messages import (
     CallbackData,
-    CommandsData,
     MessagesData,
     TextCommandsData,
     get_profile_text,
@@ -26,8 +21,7 @@ from app.shared.storage import user_storage
 router = Router()
 
 
-def _build_profile_view(user_id: int) -> tuple[str, InlineKeyboardMarkup]:
-    user_data = user_storage.get_user(user_id)
+def _build_profile_view(user_id: int, user_data: dict) -> tuple[str, InlineKeyboardMarkup]:
     usage_stats = user_storage.get_usage_stats(user_id)
     subscription = user_data.get("subscription", {})
     subscription_active = bool(subscription.get("active"))
@@ -73,21 +67,12 @@ def _build_profile_view(user_id: int) -> tuple[str, InlineKeyboardMarkup]:
     return profile_text, keyboard
 
 
-@router.message(Command(CommandsData.PREMIUM_INFO), StateFilter("*"))
-@catch_errors()
-async def premium_info_command(message: Message, state: FSMContext):
-    await state.clear()
-    await message.answer(
-        MessagesData.PREMIUM_INFO_TEXT,
-        reply_markup=get_premium_info_keyboard(),
-    )
-
-
 @router.message(F.text == TextCommandsData.PROFILE, StateFilter("*"))
 @catch_errors()
 async def profile_command(message: Message, state: FSMContext):
     await state.clear()
-    profile_text, keyboard = _build_profile_view(message.from_user.id)
+    user_id = message.from_user.id
+    profile_text, keyboard = _build_profile_view(user_id, user_storage.get_user(user_id))
     await message.answer(profile_text, reply_markup=keyboard)
 
 
@@ -110,7 +95,7 @@ async def notifications_toggle(callback: CallbackQuery):
             show_alert=True,
         )
 
-    profile_text, keyboard = _build_profile_view(user_id)
+    profile_text, keyboard = _build_profile_view(user_id, user_data)
     await callback.message.edit_text(profile_text, reply_markup=keyboard)
 
 
@@ -53,7 +53,7 @@ async def _show_spreads_selection(send_func, user_id: int):
 
     if not available_spreads:
         await send_func(
-            "⚠️ Расклады временно недоступны. Попробуйте позже.",
+            MessagesData.TAROT_UNAVAILABLE,
             reply_markup=get_back_to_main_keyboard(),
         )
         return
@@ -114,7 +114,7 @@ async def tarot_premium_spreads_callback(callback: CallbackQuery, state: FSMCont
 
     keyboard = get_spreads_keyboard(premium_spreads, is_premium=True)
     await callback.message.edit_text(
-        "💎 PREMIUM РАСКЛАДЫ\n\nВыберите расклад для детального анализа:",
+        MessagesData.TAROT_PREMIUM_SPREADS_HEADER,
         reply_markup=keyboard,
     )
     await callback.answer()
@@ -195,20 +195,20 @@ async def handle_tarot_question(message: Message, state: FSMContext):
     question = message.text.strip()
     
     if not question or not security_validator.validate_user_input(question):
-        await message.answer("❌ Некорректный вопрос. Попробуйте еще раз или нажмите кнопку 'Пропустить'.")
+        await message.answer(MessagesData.TAROT_INVALID_QUESTION)
         return
     
     user_data = await state.get_data()
     spread_key = user_data.get("selected_spread_key")
     
     if not spread_key:
-        await message.answer("❌ Ошибка: расклад не выбран. Начните заново.")
+        await message.answer(MessagesData.TAROT_SPREAD_NOT_SELECTED)
         await state.clear()
         return
     
     spread_info = get_spread_info(spread_key)
     if not spread_info:
-        await message.answer("❌ Расклад не найден.")
+        await message.answer(MessagesData.TAROT_SPREAD_NOT_FOUND)
         await state.clear()
         return
     
@@ -256,7 +256,7 @@ async def _perform_spread(send_func, user_id: int, spread_key: str, spread_info:
             cards = draw_random_cards(card_count, use_only_major=use_only_major)
 
         if not cards:
-            await send_func("❌ Ошибка при выборе карт. Попробуйте позже.", reply_markup=get_back_to_tarot_keyboard())
+            await send_func(MessagesData.TAROT_DRAW_ERROR, reply_markup=get_back_to_tarot_keyboard())
             return
 
         # Формируем результат
@@ -463,7 +463,7 @@ async def _perform_spread(send_func, user_id: int, spread_key: str, spread_info:
 
     except Exception as e:
         logger.error("Ошибка при выполнении расклада: %s", e, exc_info=True)
-        await send_func("❌ Произошла ошибка при выполнении расклада. Попробуйте позже.", reply_markup=get_back_to_tarot_keyboard())
+        await send_func(MessagesData.TAROT_READING_ERROR, reply_markup=get_back_to_tarot_keyboard())
 
 
 @router.callback_query(F.data == CallbackData.TAROT_HISTORY)
@@ -7,11 +7,19 @@ if __package__ in (None, ""):
     sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.memory import MemoryStorage
 
 from app.features import setup_routers
 from app.scheduler import get_scheduler
 from app.settings import config
+from app.shared import json_utils
+from app.shared.middlewares import (
+    ConcurrencyLimitMiddleware,
+    IgnoreNotModifiedMiddleware,
+    OutgoingRateLimitMiddleware,
+    UserRecordMiddleware,
+)
 
 # Настройка логирования
 logging.basicConfig(
@@ -24,17 +32,67 @@ logger = logging.getLogger(__name__)
 # Инициализация диспетчера
 storage = MemoryStorage()
 dp = Dispatcher(storage=storage)
+dp.update.outer_middleware(ConcurrencyLimitMiddleware(config.MAX_CONCURRENT_UPDATES))
+# Запись пользователя подгружается только для апдейтов, у которых нашелся обработчик
+dp.message.middleware(UserRecordMiddleware())
+dp.callback_query.middleware(UserRecordMiddleware())
+
+
+def warmup():
+    """
+    Прогревает кэши и ленивые пути до первого апдейта, чтобы первый
+    пользователь не платил за них временем ответа
+    """
+    from itertools import product
+
+    from app.shared import keyboards
+    from app.shared.calculations import calculate_daily_number, parse_and_life_path, validate_date
+    from app.shared.keyboards.categories import get_main_menu_keyboard_categorized
+    from app.shared.security import security_validator
+    from app.shared.texts import OPTIONS
+
+    keyboards.get_main_menu_keyboard()
+    keyboards.get_back_to_main_keyboard()
+    keyboards.get_result_keyboard()
+    keyboards.get_compatibility_result_keyboard()
+    keyboards.get_about_keyboard()
+    keyboards.get_premium_info_keyboard()
+    keyboards.get_feedback_keyboard()
+    keyboards.get_yes_no_keyboard()
+    get_main_menu_keyboard_categorized()
+    for flags in product((False, True), repeat=3):
+        keyboards.get_profile_keyboard(*flags)
+
+    security_validator.validate_user_input("01.01.2000")
+    validate_date("01.01.2000")
+    parse_and_life_path("01.01.2000")
+    calculate_daily_number()
+    logger.info("Прогрев завершен: %s наборов текстов", len(OPTIONS))
+
+
+def create_bot() -> Bot:
+    """
+    Создает единственный экземпляр бота для polling и планировщика.
+    Запросы и ответы Bot API (де)сериализуются через orjson, если он установлен;
+    отправка и редактирование сообщений идут через общий ограничитель скорости
+    """
+    session = AiohttpSession(json_loads=json_utils.loads, json_dumps=json_utils.dumps)
+    # Ответ «message is not modified» на повторную правку не считается ошибкой
+    session.middleware(IgnoreNotModifiedMiddleware())
+    session.middleware(OutgoingRateLimitMiddleware(config.OUTGOING_MESSAGES_PER_SECOND))
+    return Bot(token=config.BOT_TOKEN, session=session)
 
 
-async def on_startup():
+async def on_startup(bot_instance: Bot):
     """
     Функция, выполняемая при запуске бота
     """
     logger.info("Бот запущен!")
 
     try:
+        warmup()
+
         # Запускаем планировщик уведомлений
-        bot_instance = Bot(token=config.BOT_TOKEN)
         notification_scheduler = get_scheduler(bot_instance)
         asyncio.create_task(notification_scheduler.start())
         logger.info("Планировщик уведомлений запущен")
@@ -49,20 +107,23 @@ async def on_startup():
         logger.error(f"Ошибка при запуске бота: {e}")
 
 
-async def on_shutdown():
+async def on_shutdown(bot_instance: Bot):
     """
     Функция, выполняемая при остановке бота
     """
     logger.info("Бот остановлен!")
 
     try:
+        # Досылаем администраторам отзывы, принятые перед остановкой
+        from app.features.feedback.router import wait_pending_feedback
+        await wait_pending_feedback()
+
         # Сохраняем все ожидающие изменения в storage
         from app.shared.storage import user_storage
         await user_storage.flush_pending_saves()
         logger.info("Все изменения сохранены")
         
         # Останавливаем планировщик уведомлений
-        bot_instance = Bot(token=config.BOT_TOKEN)
         notification_scheduler = get_scheduler(bot_instance)
         notification_scheduler.stop()
         logger.info("Планировщик уведомлений остановлен")
@@ -71,6 +132,16 @@ async def on_shutdown():
         logger.error(f"Ошибка при остановке бота: {e}")
 
 
+def _install_uvloop() -> None:
+    """Включает uvloop, если он установлен (на Windows его нет — остается asyncio)"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Используется uvloop")
+
+
 def main():
     """
     Главная функция
@@ -81,15 +152,24 @@ def main():
         logger.info("Обработчики зарегистрированы")
 
         # Запуск бота
-        bot_instance = Bot(token=config.BOT_TOKEN)
+        bot_instance = create_bot()
 
         async def main_async():
-            await on_startup()
+            await on_startup(bot_instance)
             try:
-                await dp.start_polling(bot_instance, skip_updates=True)
+                # Апдейты из пачки getUpdates обрабатываются параллельно задачами,
+                # запрашиваем только те типы, на которые есть обработчики
+                await dp.start_polling(
+                    bot_instance,
+                    skip_updates=True,
+                    handle_as_tasks=True,
+                    polling_timeout=config.POLLING_TIMEOUT,
+                    allowed_updates=dp.resolve_used_update_types(),
+                )
             finally:
-                await on_shutdown()
+                await on_shutdown(bot_instance)
 
+        _install_uvloop()
         asyncio.run(main_async())
 
     except Exception as e:
@@ -7,10 +7,15 @@ import datetime
 import logging
 from collections import Counter
 from datetime import timedelta
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import Any, Dict, Sequence, Tuple
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramAPIError
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
 
 from app.settings import config
 from app.shared.astro import (
@@ -24,7 +29,7 @@ from app.shared.calculations import calculate_daily_number
 from app.shared.helpers import get_user_timezone, is_premium
 from app.shared.messages import DiaryMessages, MessagesData
 from app.shared.storage import user_storage
-from app.shared.texts import get_number_texts
+from app.shared.texts import HAS_NUMBER, OPTIONS, advance_text, peek_text
 
 try:
     from zoneinfo import ZoneInfo
@@ -71,6 +76,7 @@ class NotificationScheduler:
         self.last_digest_week: Tuple[int, int] | None = None
         self.max_retries = 3
         self.retry_delay = 5  # секунды
+        self.max_parallel_sends = 25  # одновременных отправок при рассылке
 
     async def start(self):
         """
@@ -86,11 +92,18 @@ class NotificationScheduler:
         while self.is_running:
             try:
                 await self._check_and_send_notifications()
-                await asyncio.sleep(60)  # Проверяем каждую минуту
+                # Проверяем в начале каждой минуты: sleep(60) после проверки накапливал
+                # сдвиг на время рассылки и мог перескочить целевую минуту
+                await asyncio.sleep(self._seconds_until_next_minute())
             except Exception as e:
                 logger.error(f"Ошибка в планировщике уведомлений: {e}")
                 await asyncio.sleep(300)  # При ошибке ждем 5 минут
 
+    @staticmethod
+    def _seconds_until_next_minute() -> float:
+        now = datetime.datetime.now()
+        return 60 - now.second - now.microsecond / 1_000_000
+
     def stop(self):
         """
         Останавливает планировщик уведомлений
@@ -114,9 +127,6 @@ class NotificationScheduler:
             await self._send_daily_notifications(now)
             self.last_sent_date = today
 
-            # Ждем минуту, чтобы не отправлять несколько раз
-            await asyncio.sleep(60)
-
         if now.weekday() == 0 and self.last_digest_week != now.isocalendar()[:2]:
             await self._send_weekly_digests(now)
             self.last_digest_week = now.isocalendar()[:2]
@@ -137,9 +147,7 @@ class NotificationScheduler:
         # Вычисляем число дня один раз для всех
         daily_number = calculate_daily_number()
 
-        success_count = 0
-        error_count = 0
-
+        recipients = []
         for user in users:
             notifications = user.get("notifications", {})
             notif_time = notifications.get("time")
@@ -153,16 +161,26 @@ class NotificationScheduler:
                     user_minute = self.target_minute
                 if user_hour != self.target_hour or user_minute != self.target_minute:
                     continue
-            try:
+            recipients.append(user)
+
+        # Отправки идут параллельно; темп под лимит Bot API задает общий
+        # ограничитель исходящих сообщений бота, семафор держит число запросов в полете
+        semaphore = asyncio.Semaphore(self.max_parallel_sends)
+
+        async def send_bounded(user: Dict[str, Any]):
+            async with semaphore:
                 await self._send_notification_to_user(user, daily_number)
-                success_count += 1
 
-                # Небольшая задержка между отправками
-                await asyncio.sleep(0.1)
+        results = await asyncio.gather(
+            *(send_bounded(user) for user in recipients), return_exceptions=True
+        )
 
-            except Exception as e:
+        error_count = 0
+        for user, result in zip(recipients, results):
+            if isinstance(result, Exception):
                 error_count += 1
-                logger.error(f"Ошибка отправки уведомления пользователю {user['user_id']}: {e}")
+                logger.error(f"Ошибка отправки уведомления пользователю {user['user_id']}: {result}")
+        success_count = len(results) - error_count
 
         logger.info(f"Уведомления отправлены: {success_count} успешно, {error_count} ошибок")
 
@@ -226,10 +244,8 @@ class NotificationScheduler:
             logger.info(f"Уведомление уже отправлено пользователю {user_id} сегодня")
             return
 
-        text_history = user.get("text_history", [])
-
         # Получаем текст для числа дня
-        text = self._get_daily_text(daily_number, text_history)
+        text = self._get_daily_text(daily_number, user_id)
 
         # Формируем сообщение
         message_text = (
@@ -241,30 +257,39 @@ class NotificationScheduler:
             try:
                 await self.bot.send_message(user_id, message_text)
 
-                # Добавляем текст в историю и отмечаем отправку
-                user_storage.add_text_to_history(user_id, text)
+                # Текст считается показанным только после доставки
+                advance_text(daily_number, self._daily_context(daily_number), user_id)
                 user_storage.mark_daily_notification_sent(user_id)
 
                 logger.info(f"Уведомление отправлено пользователю {user_id}")
                 return
 
             except TelegramAPIError as e:
-                if e.error_code == 403:  # Пользователь заблокировал бота
+                if isinstance(e, TelegramForbiddenError):  # Пользователь заблокировал бота
                     logger.warning(f"Пользователь {user_id} заблокировал бота")
                     user_storage.update_user(user_id, notifications={"enabled": False})
                     return
-                elif e.error_code == 400:  # Неверный запрос
+                elif isinstance(e, TelegramBadRequest):  # Неверный запрос
                     logger.error(f"Неверный запрос для пользователя {user_id}: {e}")
                     return
                 else:
-                    logger.warning(
-                        f"Попытка {attempt + 1} отправки уведомления "
-                        f"пользователю {user_id} неудачна: {e}"
-                    )
-                    if attempt < self.max_retries - 1:
-                        await asyncio.sleep(self.retry_delay)
-                    else:
-                        raise
+                    await self._wait_before_retry(attempt, e, user_id, "уведомление")
+
+    async def _wait_before_retry(self, attempt: int, error: Exception, user_id: int, what: str):
+        """
+        Логирует неудачную попытку отправки и ждет перед следующей;
+        после последней попытки пробрасывает ошибку дальше
+        """
+        logger.warning(
+            "Попытка %s отправить %s пользователю %s неудачна: %s", attempt + 1, what, user_id, error
+        )
+        if attempt >= self.max_retries - 1:
+            raise error
+        # При flood control Telegram сам говорит, сколько ждать
+        if isinstance(error, TelegramRetryAfter):
+            await asyncio.sleep(error.retry_after)
+        else:
+            await asyncio.sleep(self.retry_delay)
 
     async def _send_daily_transit_forecasts(self, now: datetime.datetime):  # noqa: C901
         if ZoneInfo is None:
@@ -388,35 +413,15 @@ class NotificationScheduler:
             try:
                 await self.bot.send_message(user_id, message_text)
                 return
-            except TelegramAPIError as e:
-                if e.error_code == 403:
-                    logger.warning("Пользователь %s заблокировал бота (ретро-оповещение)", user_id)
-                    user_storage.update_user(user_id, notifications={"enabled": False})
-                    return
-                if e.error_code == 400:
-                    logger.error("Неверный запрос при отправке ретро-оповещения %s: %s", user_id, e)
-                    return
-                logger.warning(
-                    "Попытка %s отправить ретро-оповещение пользователю %s неудачна: %s",
-                    attempt + 1,
-                    user_id,
-                    e,
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    raise
+            except TelegramForbiddenError:
+                logger.warning("Пользователь %s заблокировал бота (ретро-оповещение)", user_id)
+                user_storage.update_user(user_id, notifications={"enabled": False})
+                return
+            except TelegramBadRequest as e:
+                logger.error("Неверный запрос при отправке ретро-оповещения %s: %s", user_id, e)
+                return
             except Exception as e:
-                logger.warning(
-                    "Попытка %s отправить ретро-оповещение пользователю %s неудачна: %s",
-                    attempt + 1,
-                    user_id,
-                    e,
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay)
-                else:
-                    raise
+                await self._wait_before_retry(attempt, e, user_id, "ретро-оповещение")
 
     @staticmethod
     def _to_local(now: datetime.datetime, tz_name: str) -> datetime.datetime:
@@ -427,38 +432,25 @@ class NotificationScheduler:
         except Exception:
             return now
 
-    def _get_daily_text(self, daily_number: int, text_history: List[str]) -> str:
+    @staticmethod
+    def _daily_context(daily_number: int) -> str:
+        return "premium_daily" if (daily_number, "premium_daily") in OPTIONS else "daily"
+
+    def _get_daily_text(self, daily_number: int, user_id: int) -> str:
         """
-        Получает текст для числа дня с учетом истории
+        Получает текст для числа дня тем же перемешанным кругом, что и texts.get_text.
+        Курсор не сдвигается: после успешной отправки это делает advance_text
         """
         try:
-            number_texts = get_number_texts()
-
-            if str(daily_number) not in number_texts:
+            if daily_number not in HAS_NUMBER:
                 logger.warning(f"Нет текстов для числа дня {daily_number}")
                 return "Сегодня особенный день! Доверьтесь своей интуиции."
 
-            contexts = number_texts[str(daily_number)]
-            if not isinstance(contexts, dict):
-                logger.warning(f"Некорректный формат текстов для числа {daily_number}")
-                return "Сегодня особенный день! Доверьтесь своей интуиции."
-
-            options = contexts.get("premium_daily") or contexts.get("daily")
-
-            if not options:
+            text = peek_text(daily_number, self._daily_context(daily_number), user_id)
+            if text is None:
                 logger.warning(f"Пустой список текстов для числа дня {daily_number}")
                 return "Сегодня особенный день! Доверьтесь своей интуиции."
-
-            # Исключаем тексты, которые уже показывали
-            unused = [t for t in options if t not in text_history]
-
-            # Если все тексты показаны, очищаем историю и используем все варианты
-            if not unused:
-                unused = options
-
-            import random
-
-            return random.choice(unused)
+            return text
 
         except Exception as e:
             logger.error(f"Ошибка получения текста для числа дня {daily_number}: {e}")
@@ -470,10 +462,7 @@ class NotificationScheduler:
         """
         try:
             daily_number = calculate_daily_number()
-            user_data = user_storage.get_user(user_id)
-            text_history = user_data.get("text_history", [])
-
-            text = self._get_daily_text(daily_number, text_history)
+            text = self._get_daily_text(daily_number, user_id)
 
             message_text = (
                 f"🧪 Тестовое уведомление\n\n"
@@ -483,7 +472,7 @@ class NotificationScheduler:
             )
 
             await self.bot.send_message(user_id, message_text)
-            user_storage.add_text_to_history(user_id, text)
+            advance_text(daily_number, self._daily_context(daily_number), user_id)
             # Не отмечаем как отправленное ежедневное уведомление для теста
 
             return True
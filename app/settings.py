@@ -4,6 +4,7 @@
 
 import logging
 import os
+from dataclasses import dataclass
 from typing import Any, Dict
 
 from dotenv import load_dotenv
@@ -14,68 +15,90 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-class BotConfig:
-    """Конфигурация бота"""
+def _parse_admin_ids(raw: str) -> frozenset[int]:
+    """Разбирает список идентификаторов администраторов из ADMIN_USER_IDS"""
+    admin_ids: set[int] = set()
+    for candidate in raw.replace(";", ",").split(","):
+        value = candidate.strip()
+        if not value:
+            continue
+        try:
+            admin_ids.add(int(value))
+        except ValueError:
+            logger.warning("Некорректный идентификатор администратора: %s", value)
+    return frozenset(admin_ids)
 
-    def __init__(self):
-        self._load_config()
 
-    def _load_config(self):
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Конфигурация бота (читается из окружения один раз при импорте)"""
+
+    BOT_TOKEN: str
+    # Настройки базы данных
+    DATABASE_URL: str = "sqlite:///numerology_bot.db"
+    # Настройки уведомлений
+    NOTIFICATION_TIME: str = "11:00"
+    # Лимиты для бесплатных пользователей (уменьшено до 2 запросов в день)
+    FREE_DAILY_LIMIT: int = 2
+    FREE_COMPATIBILITY_LIMIT: int = 1
+    # Лимит повторных просмотров
+    FREE_REPEAT_VIEWS_LIMIT: int = 5
+    # Настройки подписки
+    SUBSCRIPTION_PRICE: int = 299
+    SUBSCRIPTION_DURATION: int = 30
+    # Дополнительные настройки
+    MAX_MESSAGE_LENGTH: int = 4096
+    MAX_RETRIES: int = 3
+    RETRY_DELAY: int = 5
+    GEOCODER_USER_AGENT: str = "ezoteric-bot/1.0"
+    GEOCODER_TIMEOUT: float = 5.0
+    # Настройки безопасности
+    RATE_LIMIT_PER_MINUTE: int = 10
+    MAX_INPUT_LENGTH: int = 1000
+    # Настройки long polling: таймаут getUpdates и число одновременно обрабатываемых апдейтов
+    POLLING_TIMEOUT: int = 30
+    MAX_CONCURRENT_UPDATES: int = 100
+    # Общий лимит исходящих сообщений (отправка и редактирование) в секунду
+    OUTGOING_MESSAGES_PER_SECOND: int = 30
+    # Администраторы
+    ADMIN_USER_IDS: frozenset[int] = frozenset()
+    # Настройки логирования
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "bot.log"
+
+    @classmethod
+    def from_env(cls) -> "BotConfig":
         """Загружает конфигурацию из переменных окружения"""
-        # Токен бота
-        self.BOT_TOKEN = os.getenv("BOT_TOKEN")
-        if not self.BOT_TOKEN:
+        bot_token = os.getenv("BOT_TOKEN")
+        if not bot_token:
             logger.error("BOT_TOKEN не найден в переменных окружения")
             raise ValueError("BOT_TOKEN не найден в переменных окружения")
 
-        # Настройки базы данных
-        self.DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///numerology_bot.db")
-
-        # Настройки уведомлений
-        self.NOTIFICATION_TIME = os.getenv("NOTIFICATION_TIME", "11:00")
-
-        # Лимиты для бесплатных пользователей
-        # Уменьшено до 2 запросов в день
-        self.FREE_DAILY_LIMIT = int(os.getenv("FREE_DAILY_LIMIT", "2"))
-        self.FREE_COMPATIBILITY_LIMIT = int(os.getenv("FREE_COMPATIBILITY_LIMIT", "1"))
-        # Лимит повторных просмотров
-        self.FREE_REPEAT_VIEWS_LIMIT = int(os.getenv("FREE_REPEAT_VIEWS_LIMIT", "5"))
-
-        # Настройки подписки
-        self.SUBSCRIPTION_PRICE = int(os.getenv("SUBSCRIPTION_PRICE", "299"))
-        self.SUBSCRIPTION_DURATION = int(os.getenv("SUBSCRIPTION_DURATION", "30"))
-
-        # Дополнительные настройки
-        self.MAX_MESSAGE_LENGTH = int(os.getenv("MAX_MESSAGE_LENGTH", "4096"))
-        self.MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-        self.RETRY_DELAY = int(os.getenv("RETRY_DELAY", "5"))
-        self.GEOCODER_USER_AGENT = os.getenv("GEOCODER_USER_AGENT", "ezoteric-bot/1.0")
-        self.GEOCODER_TIMEOUT = float(os.getenv("GEOCODER_TIMEOUT", "5.0"))
-
-        # Настройки безопасности
-        self.RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "10"))
-        self.MAX_INPUT_LENGTH = int(os.getenv("MAX_INPUT_LENGTH", "1000"))
-
-        # Администраторы
-        admin_ids_raw = os.getenv("ADMIN_USER_IDS", "")
-        admin_ids: set[int] = set()
-        if admin_ids_raw:
-            candidates = admin_ids_raw.replace(";", ",").split(",")
-            for candidate in candidates:
-                value = candidate.strip()
-                if not value:
-                    continue
-                try:
-                    admin_ids.add(int(value))
-                except ValueError:
-                    logger.warning("Некорректный идентификатор администратора: %s", value)
-        self.ADMIN_USER_IDS = admin_ids
-
-        # Настройки логирования
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-        self.LOG_FILE = os.getenv("LOG_FILE", "bot.log")
-
+        loaded = cls(
+            BOT_TOKEN=bot_token,
+            DATABASE_URL=os.getenv("DATABASE_URL", "sqlite:///numerology_bot.db"),
+            NOTIFICATION_TIME=os.getenv("NOTIFICATION_TIME", "11:00"),
+            FREE_DAILY_LIMIT=int(os.getenv("FREE_DAILY_LIMIT", "2")),
+            FREE_COMPATIBILITY_LIMIT=int(os.getenv("FREE_COMPATIBILITY_LIMIT", "1")),
+            FREE_REPEAT_VIEWS_LIMIT=int(os.getenv("FREE_REPEAT_VIEWS_LIMIT", "5")),
+            SUBSCRIPTION_PRICE=int(os.getenv("SUBSCRIPTION_PRICE", "299")),
+            SUBSCRIPTION_DURATION=int(os.getenv("SUBSCRIPTION_DURATION", "30")),
+            MAX_MESSAGE_LENGTH=int(os.getenv("MAX_MESSAGE_LENGTH", "4096")),
+            MAX_RETRIES=int(os.getenv("MAX_RETRIES", "3")),
+            RETRY_DELAY=int(os.getenv("RETRY_DELAY", "5")),
+            GEOCODER_USER_AGENT=os.getenv("GEOCODER_USER_AGENT", "ezoteric-bot/1.0"),
+            GEOCODER_TIMEOUT=float(os.getenv("GEOCODER_TIMEOUT", "5.0")),
+            RATE_LIMIT_PER_MINUTE=int(os.getenv("RATE_LIMIT_PER_MINUTE", "10")),
+            MAX_INPUT_LENGTH=int(os.getenv("MAX_INPUT_LENGTH", "1000")),
+            POLLING_TIMEOUT=int(os.getenv("POLLING_TIMEOUT", "30")),
+            MAX_CONCURRENT_UPDATES=int(os.getenv("MAX_CONCURRENT_UPDATES", "100")),
+            OUTGOING_MESSAGES_PER_SECOND=int(os.getenv("OUTGOING_MESSAGES_PER_SECOND", "30")),
+            ADMIN_USER_IDS=_parse_admin_ids(os.getenv("ADMIN_USER_IDS", "")),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
+            LOG_FILE=os.getenv("LOG_FILE", "bot.log"),
+        )
         logger.info("Конфигурация загружена успешно")
+        return loaded
 
     def get_all_settings(self) -> Dict[str, Any]:
         """Возвращает все настройки"""
@@ -96,13 +119,16 @@ class BotConfig:
             "ADMIN_USER_IDS": sorted(self.ADMIN_USER_IDS),
             "RATE_LIMIT_PER_MINUTE": self.RATE_LIMIT_PER_MINUTE,
             "MAX_INPUT_LENGTH": self.MAX_INPUT_LENGTH,
+            "POLLING_TIMEOUT": self.POLLING_TIMEOUT,
+            "MAX_CONCURRENT_UPDATES": self.MAX_CONCURRENT_UPDATES,
+            "OUTGOING_MESSAGES_PER_SECOND": self.OUTGOING_MESSAGES_PER_SECOND,
             "LOG_LEVEL": self.LOG_LEVEL,
             "LOG_FILE": self.LOG_FILE,
         }
 
 
 # Глобальный экземпляр конфигурации
-config = BotConfig()
+config = BotConfig.from_env()
 
 # Для обратной совместимости
 API_TOKEN = config.BOT_TOKEN
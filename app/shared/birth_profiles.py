@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -15,6 +14,8 @@ except ImportError:  # pragma: no cover - Python < 3.9 не поддержива
     ZoneInfo = None  # type: ignore[assignment]
     ZoneInfoNotFoundError = ValueError  # type: ignore[assignment]
 
+from app.shared import json_utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -151,12 +152,11 @@ class BirthProfileStorage:
         if not self.storage_path.exists():
             return {}
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as file:
-                raw = json.load(file)
-                if isinstance(raw, dict):
-                    return raw
-                logger.warning("Некорректный формат birth_profiles.json, ожидается dict")
-                return {}
+            raw = json_utils.load_file(self.storage_path)
+            if isinstance(raw, dict):
+                return raw
+            logger.warning("Некорректный формат birth_profiles.json, ожидается dict")
+            return {}
         except Exception as exc:  # noqa: BLE001 - хотим логировать любые проблемы загрузки
             logger.error("Ошибка загрузки %s: %s", self.storage_path, exc)
             return {}
@@ -164,8 +164,8 @@ class BirthProfileStorage:
     def _save(self) -> None:
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self.storage_path.with_suffix(".tmp")
-        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
-            json.dump(self.data, tmp_file, ensure_ascii=False, indent=2)
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(json_utils.dumps_bytes(self.data))
         tmp_path.replace(self.storage_path)
 
     # --------------------- CRUD операции ---------------------
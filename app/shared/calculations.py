@@ -2,20 +2,23 @@
 Модуль для нумерологических расчетов с учетом мастер-чисел
 """
 
-import json
 import random
+import re
+from calendar import monthrange
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
 
 from app.shared.calculations_data import MASTER_NUMBERS, NAME_NUMBER_FALLBACKS, NAME_NUMBER_MAP
+from app.shared.formatters import format_today_iso
+from app.shared.texts import NUMBER_TEXTS
 
-# Путь к файлу с аффирмациями
-NUMBERS_FILE = Path(__file__).resolve().parent.parent.parent / "numbers.json"
+# ДД.ММ.ГГГГ (день и месяц допускаются из одной цифры, как и раньше)
+_DATE_RE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
 
-with open(NUMBERS_FILE, "r", encoding="utf-8") as f:
-    NUMBERS_DATA = json.load(f)
+# Числа, для которых есть тексты (для случайного выбора аффирмации)
+_TEXT_NUMBERS: tuple[int, ...] = tuple(NUMBER_TEXTS)
 
 
 def reduce_number(number: int) -> int:
@@ -64,10 +67,10 @@ def get_affirmation(user_id: int | None = None, *, force_new: bool = False) -> A
 
     try:
         if user_id is None:
-            number = int(random.choice(list(NUMBERS_DATA.keys())))
-            affirmations = NUMBERS_DATA[str(number)]["affirmations"]
+            number = random.choice(_TEXT_NUMBERS)
+            affirmations = NUMBER_TEXTS[number]["affirmations"]
             chosen = random.choice(affirmations)
-            today = datetime.now().strftime("%Y-%m-%d")
+            today = format_today_iso()
             return AffirmationResult(
                 number=number,
                 text=chosen,
@@ -81,15 +84,16 @@ def get_affirmation(user_id: int | None = None, *, force_new: bool = False) -> A
 
         from .helpers import is_premium as is_premium_check
 
-        user_data = user_storage.get_user(user_id)
+        history = user_storage.get_bounded_history(user_id, "affirmation_history")
         is_premium = is_premium_check(user_id)
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = format_today_iso()
 
-        raw_history = user_data.get("affirmation_history", [])
-        normalized_history = _normalize_affirmation_history(raw_history if isinstance(raw_history, list) else [])
+        raw_history = list(history)
+        normalized_history = _normalize_affirmation_history(raw_history)
 
         if normalized_history != raw_history:
-            user_data["affirmation_history"] = normalized_history
+            history.clear()
+            history.extend(normalized_history)
             user_storage._save_data()
 
         generated_today = sum(1 for entry in normalized_history if entry.get("date") == today)
@@ -109,20 +113,20 @@ def get_affirmation(user_id: int | None = None, *, force_new: bool = False) -> A
                 was_forced=False,
             )
 
-        number_key = random.choice(list(NUMBERS_DATA.keys()))
-        affirmations = NUMBERS_DATA[number_key]["affirmations"]
-        history_texts = {entry.get("text") for entry in normalized_history[-10:] if entry.get("text")}
+        number_key = random.choice(_TEXT_NUMBERS)
+        affirmations = NUMBER_TEXTS[number_key]["affirmations"]
+        history_texts = {entry.get("text") for entry in normalized_history if entry.get("text")}
         available = [a for a in affirmations if a not in history_texts]
         chosen = random.choice(available) if available else random.choice(affirmations)
 
         new_entry = {
-            "number": int(number_key),
+            "number": number_key,
             "text": chosen,
             "date": today,
         }
 
-        updated_history = normalized_history + [new_entry]
-        user_data["affirmation_history"] = updated_history[-10:]
+        # deque(maxlen=10) сам вытесняет самую старую запись
+        history.append(new_entry)
         user_storage._save_data()
 
         return AffirmationResult(
@@ -132,7 +136,7 @@ def get_affirmation(user_id: int | None = None, *, force_new: bool = False) -> A
             is_new=True,
             is_premium_user=is_premium,
             generated_today=generated_today + 1,
-            history=user_data["affirmation_history"],
+            history=list(history),
             was_forced=effective_force,
         )
 
@@ -156,6 +160,7 @@ def get_affirmation(user_id: int | None = None, *, force_new: bool = False) -> A
         )
 
 
+@lru_cache(maxsize=65536)
 def calculate_life_path_number(birth_date: str) -> int:
     """Вычисляет число судьбы (жизненный путь) с учетом мастер-чисел"""
     try:
@@ -166,6 +171,27 @@ def calculate_life_path_number(birth_date: str) -> int:
         return 0
 
 
+@lru_cache(maxsize=65536)
+def parse_and_life_path(date_str: str) -> int | None:
+    """
+    Проверяет дату ДД.ММ.ГГГГ и сразу вычисляет число судьбы.
+
+    Возвращает None, если дата некорректна (те же правила, что в validate_date).
+    """
+    match = _DATE_RE.fullmatch(date_str) if isinstance(date_str, str) else None
+    if match is None:
+        return None
+    day, month, year = int(match[1]), int(match[2]), int(match[3])
+    if not (1900 <= year <= 2100 and 1 <= month <= 12):
+        return None
+    if not 1 <= day <= monthrange(year, month)[1]:
+        return None
+    # Цифры дня и месяца считаются с ведущим нулем, как в calculate_life_path_number
+    total = day // 10 + day % 10 + month // 10 + month % 10 + sum(map(int, match[3]))
+    return reduce_number(total)
+
+
+@lru_cache(maxsize=65536)
 def calculate_soul_number(birth_date: str) -> int:
     """Вычисляет число души (используем день рождения как упрощение)"""
     try:
@@ -194,7 +220,7 @@ def calculate_name_number(full_name: str) -> int:
 def get_name_number_description(number: int) -> str:
     """Возвращает описание для числа имени"""
     try:
-        options = NUMBERS_DATA.get(str(number), {}).get("life_path")
+        options = NUMBER_TEXTS.get(number, {}).get("life_path")
         if options:
             return random.choice(options)
     except Exception:
@@ -206,7 +232,12 @@ def calculate_daily_number(date: str = None) -> int:
     """Вычисляет число дня для прогноза"""
     if date is None:
         date = datetime.now().strftime("%d.%m.%Y")
+    return _daily_number_for(date)
 
+
+@lru_cache(maxsize=2)
+def _daily_number_for(date: str) -> int:
+    """Число дня для конкретной даты (кэшируются только сегодня и вчера)"""
     try:
         day, month, year = map(int, date.split("."))
         total = sum(int(d) for d in f"{day:02d}{month:02d}{year}")
@@ -215,25 +246,15 @@ def calculate_daily_number(date: str = None) -> int:
         return 0
 
 
+# Сюда попадает и мусорный ввод, поэтому кэш меньше, чем у расчетов по валидным датам
+@lru_cache(maxsize=8192)
 def validate_date(date_str: str) -> bool:
     """Проверяет корректность даты"""
+    match = _DATE_RE.fullmatch(date_str) if isinstance(date_str, str) else None
+    if match is None:
+        return False
     try:
-        day, month, year = map(int, date_str.split("."))
-        if year < 1900 or year > 2100:
-            return False
-        if month < 1 or month > 12:
-            return False
-        if day < 1 or day > 31:
-            return False
-        if month in [4, 6, 9, 11] and day > 30:
-            return False
-        if month == 2:
-            if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-                if day > 29:
-                    return False
-            else:
-                if day > 28:
-                    return False
-        return True
-    except Exception:
+        parsed = datetime(int(match[3]), int(match[2]), int(match[1]))
+    except ValueError:
         return False
+    return 1900 <= parsed.year <= 2100
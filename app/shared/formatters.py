@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import time
 from datetime import date, datetime
 
+# (секунда, строка) последнего вызова format_datetime_iso
+_datetime_iso_cache: tuple[int, str] = (0, "")
+
 
 def format_iso_to_display(iso_date: str, default: str = "—") -> str:
     """
@@ -62,13 +66,26 @@ def format_date_label(target_date: date, include_year: bool = False) -> str:
 
 
 def format_today_iso() -> str:
-    """Возвращает сегодняшнюю дату в формате ISO (YYYY-MM-DD)."""
-    return datetime.now().strftime("%Y-%m-%d")
+    """
+    Возвращает сегодняшнюю дату в формате ISO (YYYY-MM-DD).
+
+    Берется из кэшируемой раз в секунду строки format_datetime_iso.
+    """
+    return format_datetime_iso()[:10]
 
 
 def format_datetime_iso() -> str:
-    """Возвращает текущие дату и время в формате ISO (YYYY-MM-DD HH:MM:SS)."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """
+    Возвращает текущие дату и время в формате ISO (YYYY-MM-DD HH:MM:SS).
+
+    Строка пересобирается не чаще раза в секунду, вызовы в пределах одной
+    секунды получают готовое значение.
+    """
+    global _datetime_iso_cache
+    second = int(time.time())
+    if _datetime_iso_cache[0] != second:
+        _datetime_iso_cache = (second, datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"))
+    return _datetime_iso_cache[1]
 
 
 def format_date_iso(date_obj: date | datetime) -> str:
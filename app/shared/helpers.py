@@ -6,6 +6,7 @@ from datetime import date, datetime
 from typing import Any
 
 from app.shared.birth_profiles import birth_profile_storage
+from app.shared.formatters import format_today_iso
 from app.shared.storage import user_storage
 
 try:
@@ -16,7 +17,11 @@ except ModuleNotFoundError:  # pragma: no cover
 
 def is_premium(user_id: int) -> bool:
     """Проверяет, активна ли Premium подписка у пользователя."""
-    user = user_storage.get_user(user_id)
+    user = user_storage.get_user_readonly(user_id)
+    if user is None:
+        # Неизвестного пользователя не создаем: у администратора запись появится
+        # с первым апдейтом, тогда же включится и его Premium
+        return False
     subscription = user.get("subscription", {})
     return bool(subscription.get("active"))
 
@@ -26,7 +31,7 @@ def get_user_timezone(user_id: int) -> str:
     profile = birth_profile_storage.get_profile(user_id)
     if profile and profile.get("timezone"):
         return profile["timezone"]
-    user = user_storage.get_user(user_id)
+    user = user_storage.get_user_readonly(user_id) or {}
     return user.get("timezone") or "UTC"
 
 
@@ -516,7 +521,6 @@ def generate_daily_challenge(user_id: int) -> tuple[str, dict[str, Any]] | None:
         Кортеж (challenge_id, challenge_data) или None
     """
     import random
-    from datetime import datetime
     
     user_data = user_storage.get_user(user_id)
     stats = user_storage.get_stats(user_id)
@@ -524,7 +528,7 @@ def generate_daily_challenge(user_id: int) -> tuple[str, dict[str, Any]] | None:
     challenges = user_storage.get_daily_challenges(user_id)
     
     # Проверяем, есть ли уже задание на сегодня
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = format_today_iso()
     current = challenges.get("current")
     if current and current.get("date") == today:
         # Уже есть задание на сегодня
@@ -627,7 +631,7 @@ def check_daily_challenge_completion(user_id: int, action: str) -> tuple[bool, d
     if not current:
         return False, None
     
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = format_today_iso()
     if current.get("date") != today:
         return False, None
     
@@ -0,0 +1,42 @@
+"""
+Быстрый JSON: orjson, если установлен, иначе стандартный json
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # orjson — необязательная зависимость
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Разбирает JSON из байтов или строки"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """Сериализует значение в компактную JSON-строку"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_bytes(value: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """
+    Сериализует значение в компактный JSON в UTF-8 (для записи в файл).
+
+    Нестроковые ключи словарей приводятся к строкам, как в стандартном json
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=default).encode()
+
+
+def load_file(path) -> Any:
+    """Читает и разбирает JSON-файл целиком (в бинарном режиме)"""
+    with open(path, "rb") as f:
+        return loads(f.read())
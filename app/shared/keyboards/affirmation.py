@@ -1,10 +1,13 @@
 """Клавиатура для блока аффирмаций."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from ..messages import CallbackData
 
 
+@lru_cache(maxsize=2)
 def get_affirmation_keyboard(is_premium: bool) -> InlineKeyboardMarkup:
     buttons: list[list[InlineKeyboardButton]] = [
         [InlineKeyboardButton(text="📔 Записать ощущение", callback_data=CallbackData.DIARY_OBSERVATION)]
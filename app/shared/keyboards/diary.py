@@ -1,12 +1,14 @@
 """Клавиатуры для дневника наблюдений."""
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from ..messages import CallbackData, DiaryMessages
 
 
-def get_diary_category_keyboard() -> InlineKeyboardMarkup:
-    buttons = [
+_DIARY_CATEGORY_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
         [
             InlineKeyboardButton(text="✨ Чувство", callback_data="diary_category:feeling"),
             InlineKeyboardButton(text="📅 Событие", callback_data="diary_category:event"),
@@ -22,17 +24,26 @@ def get_diary_category_keyboard() -> InlineKeyboardMarkup:
         [InlineKeyboardButton(text="➡️ Пропустить", callback_data="diary_category:skip")],
         [InlineKeyboardButton(text="↩️ Выйти", callback_data="diary_category:cancel")],
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+)
 
 
-def get_diary_result_keyboard() -> InlineKeyboardMarkup:
-    buttons = [
+def get_diary_category_keyboard() -> InlineKeyboardMarkup:
+    return _DIARY_CATEGORY_KEYBOARD
+
+
+_DIARY_RESULT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
         [InlineKeyboardButton(text=DiaryMessages.HISTORY_BUTTON, callback_data="diary_history:last3")],
         [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)],
     ]
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+)
+
+
+def get_diary_result_keyboard() -> InlineKeyboardMarkup:
+    return _DIARY_RESULT_KEYBOARD
 
 
+@lru_cache(maxsize=2)
 def get_diary_history_keyboard(is_premium: bool) -> InlineKeyboardMarkup:
     buttons = [[InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)]]
     if not is_premium:
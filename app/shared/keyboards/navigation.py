@@ -7,13 +7,15 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ..messages import CallbackData
 
 
+_BACK_TO_MAIN_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)]
+    ]
+)
+
+
 def get_back_to_main_keyboard() -> InlineKeyboardMarkup:
     """
-    Создает простую клавиатуру с кнопкой "В главное меню"
+    Возвращает простую клавиатуру с кнопкой "В главное меню"
     """
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)]
-        ]
-    )
-    return keyboard
+    return _BACK_TO_MAIN_KEYBOARD
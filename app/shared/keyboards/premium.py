@@ -7,19 +7,21 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ..messages import CallbackData
 
 
+_PREMIUM_INFO_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="💎 Оформить Premium", callback_data=CallbackData.SUBSCRIBE)],
+        [
+            InlineKeyboardButton(
+                text="📋 Что входит в Premium", callback_data=CallbackData.PREMIUM_FEATURES
+            )
+        ],
+        [InlineKeyboardButton(text="↩️ Назад", callback_data=CallbackData.BACK_ABOUT)],
+    ]
+)
+
+
 def get_premium_info_keyboard() -> InlineKeyboardMarkup:
     """
-    Создает клавиатуру для информации о Premium
+    Возвращает клавиатуру для информации о Premium
     """
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="💎 Оформить Premium", callback_data=CallbackData.SUBSCRIBE)],
-            [
-                InlineKeyboardButton(
-                    text="📋 Что входит в Premium", callback_data=CallbackData.PREMIUM_FEATURES
-                )
-            ],
-            [InlineKeyboardButton(text="↩️ Назад", callback_data=CallbackData.BACK_ABOUT)],
-        ]
-    )
-    return keyboard
+    return _PREMIUM_INFO_KEYBOARD
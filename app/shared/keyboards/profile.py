@@ -2,18 +2,24 @@
 Клавиатуры для профиля пользователя
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from ..messages import CallbackData
 
 
+@lru_cache(maxsize=8)
 def get_profile_keyboard(
     has_calculated: bool = False,
     notifications_enabled: bool = False,
     subscription_active: bool = False,
 ) -> InlineKeyboardMarkup:
     """
-    Создает клавиатуру для профиля пользователя
+    Создает клавиатуру для профиля пользователя.
+
+    Вариантов всего восемь (три флага), поэтому готовые объекты кэшируются
+    и переиспользуются между сообщениями.
     """
     toggle_text = (
         "🔕 Выключить уведомления" if notifications_enabled else "🔔 Включить уведомления"
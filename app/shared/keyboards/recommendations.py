@@ -2,11 +2,35 @@
 Клавиатуры для персонализированных рекомендаций.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from ..messages import CallbackData, TextCommandsData
+from ..messages import CallbackData, CommandsData, TextCommandsData
+
+# Маппинг callback -> текст кнопки
+_BUTTON_TEXTS = {
+    "diary_observation": "📝 Записать в дневник",
+    "tarot": "🔮 Получить карту",
+    "compatibility": "💑 Проверить совместимость",
+    "natal_profile": "🌌 Заполнить профиль",
+    "natal_chart": "🌌 Натальная карта",
+    "lunar_planner": "🌙 Планировщик",
+}
+
+# Преобразование action_callback в правильный callback_data
+_CALLBACK_MAPPING = {
+    "diary_observation": CallbackData.DIARY_OBSERVATION,
+    "tarot": CallbackData.TAROT_SELECT_SPREAD,
+    "compatibility": TextCommandsData.COMPATIBILITY,
+    "natal_profile": CommandsData.NATAL_PROFILE,
+    "natal_chart": TextCommandsData.NATAL_CHART,
+    "lunar_planner": TextCommandsData.LUNAR_PLANNER,
+}
 
 
+# Вариантов немного (по одному на действие + запасной), собираем каждый один раз
+@lru_cache(maxsize=16)
 def get_recommendation_keyboard(action_callback: str) -> InlineKeyboardMarkup:
     """
     Создает клавиатуру для рекомендации с кнопкой действия.
@@ -17,32 +41,10 @@ def get_recommendation_keyboard(action_callback: str) -> InlineKeyboardMarkup:
     Returns:
         InlineKeyboardMarkup с кнопкой действия
     """
-    # Маппинг callback -> текст кнопки
-    button_texts = {
-        "diary_observation": "📝 Записать в дневник",
-        "tarot": "🔮 Получить карту",
-        "compatibility": "💑 Проверить совместимость",
-        "natal_profile": "🌌 Заполнить профиль",
-        "natal_chart": "🌌 Натальная карта",
-        "lunar_planner": "🌙 Планировщик",
-    }
-    
-    button_text = button_texts.get(action_callback, "Попробовать")
-    
-    # Преобразуем action_callback в правильный callback_data
-    from ..messages import CommandsData
-    callback_mapping = {
-        "diary_observation": CallbackData.DIARY_OBSERVATION,
-        "tarot": CallbackData.TAROT_SELECT_SPREAD,
-        "compatibility": TextCommandsData.COMPATIBILITY,
-        "natal_profile": CommandsData.NATAL_PROFILE,
-        "natal_chart": TextCommandsData.NATAL_CHART,
-        "lunar_planner": TextCommandsData.LUNAR_PLANNER,
-    }
-    
-    callback_data = callback_mapping.get(action_callback, CallbackData.BACK_MAIN)
-    
-    keyboard = InlineKeyboardMarkup(
+    button_text = _BUTTON_TEXTS.get(action_callback, "Попробовать")
+    callback_data = _CALLBACK_MAPPING.get(action_callback, CallbackData.BACK_MAIN)
+
+    return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
@@ -58,5 +60,3 @@ def get_recommendation_keyboard(action_callback: str) -> InlineKeyboardMarkup:
             ],
         ]
     )
-    return keyboard
-
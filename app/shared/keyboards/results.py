@@ -7,41 +7,45 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from ..messages import CallbackData
 
 
+_RESULT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(
+                text="🔒 Полная расшифровка (Премиум)", callback_data=CallbackData.PREMIUM_FULL
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                text="📋 Посмотреть снова", callback_data=CallbackData.LIFE_PATH_NUMBER_AGAIN
+            )
+        ],
+        [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)],
+    ]
+)
+
+
 def get_result_keyboard() -> InlineKeyboardMarkup:
     """
-    Создает клавиатуру для результата расчета
+    Возвращает клавиатуру для результата расчета
     """
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="🔒 Полная расшифровка (Премиум)", callback_data=CallbackData.PREMIUM_FULL
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    text="📋 Посмотреть снова", callback_data=CallbackData.LIFE_PATH_NUMBER_AGAIN
-                )
-            ],
-            [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)],
-        ]
-    )
-    return keyboard
+    return _RESULT_KEYBOARD
+
+
+_COMPATIBILITY_RESULT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(
+                text="🔒 Детальный разбор (Премиум)",
+                callback_data=CallbackData.PREMIUM_COMPATIBILITY,
+            )
+        ],
+        [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)],
+    ]
+)
 
 
 def get_compatibility_result_keyboard() -> InlineKeyboardMarkup:
     """
-    Создает клавиатуру для результата совместимости
+    Возвращает клавиатуру для результата совместимости
     """
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="🔒 Детальный разбор (Премиум)",
-                    callback_data=CallbackData.PREMIUM_COMPATIBILITY,
-                )
-            ],
-            [InlineKeyboardButton(text="↩️ В главное меню", callback_data=CallbackData.BACK_MAIN)],
-        ]
-    )
-    return keyboard
+    return _COMPATIBILITY_RESULT_KEYBOARD
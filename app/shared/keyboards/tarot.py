@@ -2,7 +2,7 @@
 
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
-from ..messages import CallbackData
+from ..messages import CallbackData, MessagesData
 
 
 def get_spreads_keyboard(available_spreads: dict, is_premium: bool = False) -> InlineKeyboardMarkup:
@@ -61,24 +61,27 @@ def get_spreads_keyboard(available_spreads: dict, is_premium: bool = False) -> I
     return InlineKeyboardMarkup(inline_keyboard=buttons)
 
 
+_BACK_TO_TAROT_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text="🔮 Выбрать другой расклад", callback_data=CallbackData.TAROT_SELECT_SPREAD)],
+        [InlineKeyboardButton(text="📜 История раскладов", callback_data=CallbackData.TAROT_HISTORY)],
+        [InlineKeyboardButton(text="↩️ Назад в меню", callback_data=CallbackData.BACK_MAIN)],
+    ]
+)
+
+_TAROT_QUESTION_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [InlineKeyboardButton(text=MessagesData.TAROT_QUESTION_SKIP, callback_data=CallbackData.TAROT_QUESTION_SKIP)],
+        [InlineKeyboardButton(text="↩️ Назад", callback_data=CallbackData.TAROT_SELECT_SPREAD)],
+    ]
+)
+
+
 def get_back_to_tarot_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору расклада."""
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text="🔮 Выбрать другой расклад", callback_data=CallbackData.TAROT_SELECT_SPREAD)],
-            [InlineKeyboardButton(text="📜 История раскладов", callback_data=CallbackData.TAROT_HISTORY)],
-            [InlineKeyboardButton(text="↩️ Назад в меню", callback_data=CallbackData.BACK_MAIN)],
-        ]
-    )
+    return _BACK_TO_TAROT_KEYBOARD
 
 
 def get_tarot_question_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура для вопроса перед раскладом."""
-    from ..messages import MessagesData
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [InlineKeyboardButton(text=MessagesData.TAROT_QUESTION_SKIP, callback_data=CallbackData.TAROT_QUESTION_SKIP)],
-            [InlineKeyboardButton(text="↩️ Назад", callback_data=CallbackData.TAROT_SELECT_SPREAD)],
-        ]
-    )
-
+    return _TAROT_QUESTION_KEYBOARD
@@ -461,6 +461,7 @@ class MessagesData:
         "Расскажите, что вам нравится или что можно улучшить.\n"
         "Ваш отзыв помогает делать бота лучше."
     )
+    FEEDBACK_ADMIN_NOTIFICATION: str = "📝 Отзыв от пользователя {user_id}:\n\n{text}"
     UNKNOWN: str = "❓ Не понимаю эту команду. Используйте меню или /help"
     
     # Стрики и достижения
@@ -527,6 +528,18 @@ class MessagesData:
         "(например, 15.05.1990)\n\n"
         "💡 Вы можете рассчитать число для любой даты"
     )
+    LIFE_PATH_RESULT: str = (
+        "🔮 ВАШЕ ЧИСЛО СУДЬБЫ: {life_path}\n\n"
+        "{text}\n\n"
+        "📅 Дата: {birth_date}\n"
+        "💡 Вы можете рассчитать число для другой даты или повторно просмотреть этот результат"
+    )
+    LIFE_PATH_RESULT_SHORT: str = "🔮 ВАШЕ ЧИСЛО СУДЬБЫ: {life_path}\n{text}\n📅 Дата: {birth_date}"
+    COMPATIBILITY_RESULT: str = (
+        "💑 СОВМЕСТИМОСТЬ: {first_number} и {second_number}\nОценка: {score}/9\n{description}"
+    )
+    COMPATIBILITY_FIRST_DATE_PROMPT: str = "Введите первую дату рождения (ДД.ММ.ГГГГ):"
+    COMPATIBILITY_SECOND_DATE_PROMPT: str = "Введите вторую дату рождения (ДД.ММ.ГГГГ):"
     YES_NO_PROMPT: str = (
         "🔮 Задайте вопрос, на который можно ответить 'Да', 'Нет' или 'Скорее нет'.\n"
         "Напишите его текстом — я подскажу интуитивный ответ."
@@ -536,6 +549,9 @@ class MessagesData:
         "🔮 ТАРО\n\n"
         "Выберите расклад для гадания. Каждый расклад даст вам инсайты и ответы на ваши вопросы."
     )
+    TAROT_PREMIUM_SPREADS_HEADER: str = (
+        "💎 PREMIUM РАСКЛАДЫ\n\nВыберите расклад для детального анализа:"
+    )
     TAROT_SPREAD_SELECTED: str = "🎴 Выбран расклад: {spread_name}\n\n{description}"
     TAROT_RESULT_HEADER: str = "🔮 Результат расклада: {spread_name}\n\n"
     TAROT_PREMIUM_REQUIRED: str = (
@@ -552,6 +568,14 @@ class MessagesData:
         "• 'Что нужно учесть в ближайшее время?'"
     )
     TAROT_QUESTION_SKIP: str = "⏭️ Пропустить вопрос"
+    TAROT_UNAVAILABLE: str = "⚠️ Расклады временно недоступны. Попробуйте позже."
+    TAROT_INVALID_QUESTION: str = (
+        "❌ Некорректный вопрос. Попробуйте еще раз или нажмите кнопку 'Пропустить'."
+    )
+    TAROT_SPREAD_NOT_SELECTED: str = "❌ Ошибка: расклад не выбран. Начните заново."
+    TAROT_SPREAD_NOT_FOUND: str = "❌ Расклад не найден."
+    TAROT_DRAW_ERROR: str = "❌ Ошибка при выборе карт. Попробуйте позже."
+    TAROT_READING_ERROR: str = "❌ Произошла ошибка при выполнении расклада. Попробуйте позже."
     TAROT_HISTORY_EMPTY: str = "📜 История раскладов пуста. Сделайте первый расклад!"
     TAROT_HISTORY_TITLE: str = "📜 История ваших раскладов ({count}):\n"
     TAROT_HISTORY_ITEM: str = (
@@ -673,6 +697,7 @@ class DiaryMessages:
     CATEGORY_PROMPT: str = "Выберите тему для записи или пропустите шаг."
     CATEGORY_CONFIRMED: str = "Тема выбрана: {category}. Теперь опишите своё наблюдение."
     CATEGORY_SKIPPED: str = "Продолжаем без темы. Опишите своё наблюдение."
+    SAVED: str = "📝 Наблюдение сохранено!\nВаше число судьбы: {number}\nТема: {category}\nДата: {date}"
     HISTORY_BUTTON: str = "📜 Показать последние записи"
     HISTORY_EMPTY: str = "📭 В дневнике пока нет записей."
     HISTORY_TITLE: str = "📚 Последние записи:\n{entries}"
@@ -707,12 +732,7 @@ def get_format_life_path_result(life_path: int, text: str, birth_date: str) -> s
     :param birth_date: Дата рождения пользователя
     :return: Отформатированная строка для ответа пользователю
     """
-    return (
-        f"🔮 ВАШЕ ЧИСЛО СУДЬБЫ: {life_path}\n\n"
-        f"{text}\n\n"
-        f"📅 Дата: {birth_date}\n"
-        f"💡 Вы можете рассчитать число для другой даты или повторно просмотреть этот результат"
-    )
+    return MessagesData.LIFE_PATH_RESULT.format(life_path=life_path, text=text, birth_date=birth_date)
 
 
 def get_daily_number(daily_number: str) -> str:
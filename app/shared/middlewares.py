@@ -0,0 +1,128 @@
+"""
+Middleware диспетчера
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiogram.methods import EditMessageReplyMarkup, EditMessageText, SendMessage, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+from aiogram.types import TelegramObject, User
+
+from app.shared.storage import user_storage
+
+
+class ConcurrencyLimitMiddleware(BaseMiddleware):
+    """
+    Ограничивает число апдейтов, обрабатываемых одновременно.
+
+    Диспетчер запускает каждый апдейт отдельной задачей (handle_as_tasks),
+    семафор не дает пачке из getUpdates разом занять все ресурсы.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self._semaphore:
+            return await handler(event, data)
+
+
+class UserRecordMiddleware(BaseMiddleware):
+    """
+    Передает обработчику запись пользователя в аргументе ``user_data``.
+
+    Запись берется только для чтения: не создается и не обновляет last_activity,
+    для нового пользователя ``user_data`` равен None. Обработчики, которые пишут
+    в запись, получают ее сами через user_storage.get_user.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        from_user: User | None = data.get("event_from_user")
+        if from_user is not None:
+            data["user_data"] = user_storage.get_user_readonly(from_user.id)
+        return await handler(event, data)
+
+
+class OutgoingRateLimitMiddleware(BaseRequestMiddleware):
+    """
+    Сглаживает исходящие сообщения под общий лимит Bot API (~30 в секунду).
+
+    Bot API не умеет пакетно отправлять или редактировать сообщения, поэтому
+    вместо склейки запросов они расходятся по равномерным слотам: до ``rate``
+    запросов проходят сразу, остальные ждут своей очереди, а не получают 429.
+    Если Telegram все же ответил flood control, все следующие отправки ждут
+    retry_after. Остальные методы (answerCallbackQuery, getUpdates) не ограничиваются.
+    """
+
+    LIMITED_METHODS = (SendMessage, EditMessageText, EditMessageReplyMarkup)
+
+    def __init__(self, rate: int, period: float = 1.0) -> None:
+        self._interval = period / rate
+        self._burst = (rate - 1) * self._interval
+        self._next_slot = 0.0
+
+    async def _acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(self._next_slot, now - self._burst)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not isinstance(method, self.LIMITED_METHODS):
+            return await make_request(bot, method)
+        await self._acquire()
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            now = asyncio.get_running_loop().time()
+            self._next_slot = max(self._next_slot, now + e.retry_after)
+            raise
+
+
+class IgnoreNotModifiedMiddleware(BaseRequestMiddleware):
+    """
+    Гасит ответ «message is not modified» на повторную правку тем же содержимым.
+
+    Повторный клик по той же кнопке дает тот же текст и ту же клавиатуру —
+    Telegram отклоняет такую правку, и обработчик падал бы на TelegramBadRequest.
+    Запрос при этом уходит всегда, так что сообщение, измененное иначе, не
+    пропускается. Вместо ошибки возвращается ``True`` — допустимый результат
+    edit-методов по Bot API; остальные ошибки пробрасываются как есть.
+    """
+
+    EDIT_METHODS = (EditMessageText, EditMessageReplyMarkup)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not isinstance(method, self.EDIT_METHODS):
+            return await make_request(bot, method)
+        try:
+            return await make_request(bot, method)
+        except TelegramBadRequest as e:
+            if "message is not modified" not in e.message:
+                raise
+            return True
@@ -1,19 +1,27 @@
 import html
 import logging
-from datetime import datetime
+import re
+import time
+from collections import deque
 from typing import Dict
 
 from app.settings import config
 
 logger = logging.getLogger(__name__)
 
+# День, месяц и год из цифр через точку; диапазоны проверяются после разбора
+_DATE_FORMAT_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)")
+# Все подозрительные шаблоны одной альтернативой: один проход по тексту без lower()
+_SUSPICIOUS_RE = re.compile(r"<script|javascript:|data:|vbscript:", re.IGNORECASE)
+
 
 class SecurityValidator:
     """Валидатор безопасности"""
 
     def __init__(self):
-        # Сохраняем историю запросов отдельно по действиям
-        self.rate_limit_cache: Dict[str, Dict[int, list]] = {
+        # История запросов по действиям: пользователь -> deque отметок time.monotonic()
+        # (не длиннее лимита действия, самые старые слева)
+        self.rate_limit_cache: Dict[str, Dict[int, deque]] = {
             "feedback": {},
             "diary": {},
         }
@@ -27,29 +35,31 @@ class SecurityValidator:
         }
         self.max_input_length = 1000
 
+    @staticmethod
+    def _drop_expired(user_requests: deque, current_time: float, limit_seconds: int) -> None:
+        """Убирает запросы старше окна лимита — они всегда в начале очереди"""
+        cutoff = current_time - limit_seconds
+        while user_requests and user_requests[0] <= cutoff:
+            user_requests.popleft()
+
     def rate_limit_check(self, user_id: int, action: str) -> bool:
         """
         Проверяет лимит запросов пользователя для конкретного действия
         """
         try:
-            if action not in self.rate_limit_cache:
-                self.rate_limit_cache[action] = {}
+            users = self.rate_limit_cache.setdefault(action, {})
+            max_requests = self.max_requests_per_minute.get(action, 1)
+            limit_seconds = self.rate_limit_seconds.get(action, 60)
+            # Монотонные часы: окно относительное, переводы системного времени не влияют
+            current_time = time.monotonic()
 
-            current_time = datetime.now()
-            user_requests = self.rate_limit_cache[action].get(user_id, [])
+            user_requests = users.get(user_id)
+            if user_requests is None:
+                user_requests = users[user_id] = deque(maxlen=max_requests)
 
-            # Очистка старых запросов
-            limit_seconds = self.rate_limit_seconds.get(action, 60)
-            user_requests = [
-                t
-                for t in user_requests
-                if (current_time - t).total_seconds() >= 0
-                and (current_time - t).total_seconds() < limit_seconds
-            ]
-            self.rate_limit_cache[action][user_id] = user_requests
+            self._drop_expired(user_requests, current_time, limit_seconds)
 
             # Проверяем лимит
-            max_requests = self.max_requests_per_minute.get(action, 1)
             if len(user_requests) >= max_requests:
                 logger.warning(
                     f"Превышен лимит '{action}' для пользователя {user_id} "
@@ -58,7 +68,7 @@ class SecurityValidator:
                 return False
 
             # Добавляем текущий запрос
-            self.rate_limit_cache[action][user_id].append(current_time)
+            user_requests.append(current_time)
             return True
 
         except Exception as e:
@@ -73,12 +83,14 @@ class SecurityValidator:
             if len(text) > self.max_input_length:
                 logger.warning(f"Превышена максимальная длина ввода: {len(text)}")
                 return False
-            suspicious_chars = ["<script", "javascript:", "data:", "vbscript:"]
-            text_lower = text.lower()
-            for char in suspicious_chars:
-                if char in text_lower:
-                    logger.warning(f"Обнаружен подозрительный символ в вводе: {char}")
-                    return False
+            # Все подозрительные шаблоны содержат "<" или ":" — без них текст
+            # заведомо чистый и поиск по регулярному выражению не нужен
+            if "<" not in text and ":" not in text:
+                return True
+            match = _SUSPICIOUS_RE.search(text)
+            if match is not None:
+                logger.warning(f"Обнаружен подозрительный символ в вводе: {match[0].lower()}")
+                return False
             return True
         except Exception as e:
             logger.error(f"Ошибка в validate_user_input: {e}")
@@ -98,35 +110,24 @@ class SecurityValidator:
 
     def validate_date_format(self, date_str: str) -> bool:
         """Валидирует формат даты ДД.ММ.ГГГГ"""
-        try:
-            if not date_str or not isinstance(date_str, str):
-                return False
-            parts = date_str.split(".")
-            if len(parts) != 3:
-                return False
-            day, month, year = parts
-            if not (day.isdigit() and month.isdigit() and year.isdigit()):
-                return False
-            day, month, year = int(day), int(month), int(year)
-            if not (1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= 2100):
-                return False
-            return True
-        except Exception as e:
-            logger.error(f"Ошибка в validate_date_format: {e}")
+        if not date_str or not isinstance(date_str, str):
+            return False
+        match = _DATE_FORMAT_RE.fullmatch(date_str)
+        if match is None:
             return False
+        day, month, year = int(match[1]), int(match[2]), int(match[3])
+        return 1 <= day <= 31 and 1 <= month <= 12 and 1900 <= year <= 2100
 
     def cleanup_old_requests(self):
         """Очищает устаревшие запросы по всем действиям"""
         try:
-            current_time = datetime.now()
+            current_time = time.monotonic()
             for action, users in self.rate_limit_cache.items():
+                limit_seconds = self.rate_limit_seconds.get(action, 60)
                 for user_id in list(users.keys()):
-                    users[user_id] = [
-                        t
-                        for t in users[user_id]
-                        if (current_time - t).total_seconds() < self.rate_limit_seconds.get(action, 60)
-                    ]
-                    if not users[user_id]:
+                    user_requests = users[user_id]
+                    self._drop_expired(user_requests, current_time, limit_seconds)
+                    if not user_requests:
                         del users[user_id]
         except Exception as e:
             logger.error(f"Ошибка в cleanup_old_requests: {e}")
@@ -1,15 +1,29 @@
 import asyncio
-import json
 import logging
-from datetime import datetime
+import os
+from collections import deque
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from app.settings import config
+from app.shared import json_utils
+from app.shared.formatters import format_datetime_iso, format_today_iso
 from app.shared.security import is_admin
 
 logger = logging.getLogger(__name__)
 
+# Истории ограниченной длины: в памяти это deque(maxlen=N), на диске — обычный список
+BOUNDED_HISTORIES: Dict[str, int] = {
+    "affirmation_history": 10,
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, deque):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class UserStorage:
     def __init__(self, storage_file: str = "users_data.json"):
@@ -17,55 +31,94 @@ class UserStorage:
         base_dir = Path(__file__).resolve().parent.parent.parent
         self.storage_file = base_dir / storage_file
         self.data: Dict[str, Any] = self._load_data()
+        # Индекс пользователей с включенными уведомлениями (ключи как в self.data)
+        self._notifications_enabled: set[str] = {
+            uid
+            for uid, user in self.data.items()
+            if isinstance(user, dict) and user.get("notifications", {}).get("enabled", False)
+        }
         # Асинхронное сохранение
         self._save_task: Optional[asyncio.Task] = None
-        self._pending_save = False
+        # Есть ли изменения, которые еще не записаны на диск
+        self._dirty = False
         self._last_save_time = 0.0
         self._save_lock: Optional[asyncio.Lock] = None  # Инициализируем при первом использовании
         self._save_debounce_delay = 0.5  # Сохранять максимум раз в 0.5 секунды
-    
+
     async def flush_pending_saves(self):
         """Принудительно сохраняет все ожидающие изменения (используется при shutdown)."""
-        if self._pending_save:
+        if not self._dirty and (self._save_task is None or self._save_task.done()):
+            return
+        try:
+            # Ждем завершения задачи, если она запущена, затем дописываем остаток
+            if self._save_task and not self._save_task.done():
+                await self._save_task
+            await self._save_data_async()
+        except Exception as e:
+            logger.error(f"Ошибка при финальном сохранении: {e}", exc_info=True)
+            # В случае ошибки пытаемся сохранить синхронно
             try:
-                if self._save_lock is None:
-                    self._save_lock = asyncio.Lock()
-                await self._save_data_async()
-                # Ждем завершения задачи, если она запущена
-                if self._save_task and not self._save_task.done():
-                    await self._save_task
-            except Exception as e:
-                logger.error(f"Ошибка при финальном сохранении: {e}", exc_info=True)
-                # В случае ошибки пытаемся сохранить синхронно
-                try:
-                    self._save_data_sync()
-                except Exception as sync_error:
-                    logger.error(f"Критическая ошибка синхронного сохранения: {sync_error}")
+                self._save_data_sync()
+            except Exception as sync_error:
+                logger.error(f"Критическая ошибка синхронного сохранения: {sync_error}")
 
     def _load_data(self) -> Dict[str, Any]:
         if self.storage_file.exists():
             try:
-                with open(self.storage_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    logger.info(f"Данные загружены из {self.storage_file}")
-                    return data
-            except Exception as e:
+                data = json_utils.load_file(self.storage_file)
+            except (OSError, ValueError) as e:
+                # ValueError покрывает ошибки разбора и json, и orjson
                 logger.error(f"Ошибка загрузки {self.storage_file}: {e}")
                 return {}
+            if not isinstance(data, dict):
+                logger.error(f"Некорректный формат {self.storage_file}, ожидается dict")
+                return {}
+            for user in data.values():
+                if isinstance(user, dict):
+                    # Повторы текстов отсекает text_cursors, старая история не читается
+                    user.pop("text_history", None)
+                    self._wrap_histories(user)
+            logger.info(f"Данные загружены из {self.storage_file}")
+            return data
         return {}
 
+    def _mark_dirty(self):
+        """Отмечает, что данные изменились и их нужно записать на диск."""
+        self._dirty = True
+
+    def _serialize(self) -> bytes:
+        """
+        Снимок данных в JSON (orjson, если установлен). Выполняется в потоке
+        event loop, пока данные не меняются.
+
+        Без отступов: файл пишется при каждом сбросе изменений, а indent=2
+        примерно вдвое замедляет сериализацию и раздувает файл.
+        """
+        return json_utils.dumps_bytes(self.data, default=_json_default)
+
+    def _write_payload(self, payload: bytes):
+        """
+        Записывает готовый снимок на диск (безопасно вызывать из рабочего потока).
+
+        Снимок пишется во временный файл и атомарно подменяет основной: до
+        os.replace на диске остается прежняя целая версия, отдельная копия-бэкап не нужна.
+        """
+        tmp_file = self.storage_file.with_name(f"{self.storage_file.name}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.storage_file)
+        logger.debug(f"Данные сохранены в {self.storage_file}")
+
     def _save_data_sync(self):
         """Синхронное сохранение данных (используется при инициализации)."""
+        # Сбрасываем флаг до записи: изменения, сделанные во время записи, снова его поднимут
+        self._dirty = False
         try:
-            backup_file = f"{self.storage_file}.backup"
-            if self.storage_file.exists():
-                with open(self.storage_file, "r", encoding="utf-8") as src:
-                    with open(backup_file, "w", encoding="utf-8") as dst:
-                        dst.write(src.read())
-            with open(self.storage_file, "w", encoding="utf-8") as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"Данные сохранены в {self.storage_file}")
+            self._write_payload(self._serialize())
         except Exception as e:
+            self._dirty = True
             logger.error(f"Ошибка сохранения данных: {e}", exc_info=True)
             raise
 
@@ -74,40 +127,42 @@ class UserStorage:
         # Инициализируем lock при необходимости
         if self._save_lock is None:
             self._save_lock = asyncio.Lock()
-        
+
         async with self._save_lock:
-            if not self._pending_save:
-                return
-            
-            # Debouncing: проверяем, прошло ли достаточно времени с последнего сохранения
             loop = asyncio.get_event_loop()
-            current_time = loop.time()
-            time_since_last_save = current_time - self._last_save_time
-            
-            if time_since_last_save < self._save_debounce_delay:
-                # Ждем оставшееся время
-                await asyncio.sleep(self._save_debounce_delay - time_since_last_save)
-            
-            try:
-                # Сохраняем данные синхронно (I/O операция)
-                # Используем run_in_executor для неблокирующей записи
-                await loop.run_in_executor(None, self._save_data_sync)
-                self._last_save_time = loop.time()
-                self._pending_save = False
-            except Exception as e:
-                logger.error(f"Ошибка асинхронного сохранения данных: {e}", exc_info=True)
+            while self._dirty:
+                # Debouncing: проверяем, прошло ли достаточно времени с последнего сохранения
+                time_since_last_save = loop.time() - self._last_save_time
+                if time_since_last_save < self._save_debounce_delay:
+                    # Ждем оставшееся время
+                    await asyncio.sleep(self._save_debounce_delay - time_since_last_save)
+
+                # Снимок делаем в event loop (хендлеры не меняют данные посреди сериализации),
+                # а медленную запись на диск отдаем в отдельный поток
+                self._dirty = False
+                try:
+                    payload = self._serialize()
+                    await asyncio.to_thread(self._write_payload, payload)
+                    self._last_save_time = loop.time()
+                except Exception as e:
+                    self._dirty = True
+                    logger.error(f"Ошибка асинхронного сохранения данных: {e}", exc_info=True)
+                    return
 
     def _save_data(self, immediate: bool = False):
         """
         Помечает данные для сохранения и запускает асинхронное сохранение.
-        
+
+        Вызывать только после реального изменения данных: запись на диск
+        происходит лишь при поднятом флаге изменений.
+
         Args:
             immediate: Если True, сохраняет немедленно (блокирующий вызов)
         """
+        self._mark_dirty()
         if immediate:
             # Для критичных операций (например, при старте) сохраняем сразу
             self._save_data_sync()
-            self._pending_save = False
             try:
                 loop = asyncio.get_event_loop()
                 if loop.is_running():
@@ -131,14 +186,40 @@ class UserStorage:
                 # Если нет активного event loop, сохраняем синхронно
                 logger.warning("Нет активного event loop, сохранение синхронно")
                 self._save_data_sync()
-                self._pending_save = False
+
+    @staticmethod
+    def _wrap_histories(user: Dict[str, Any]) -> None:
+        """Переводит ограниченные истории пользователя в deque с нужным maxlen."""
+        for key, maxlen in BOUNDED_HISTORIES.items():
+            history = user.get(key)
+            if not isinstance(history, deque) or history.maxlen != maxlen:
+                user[key] = deque(history if isinstance(history, (list, deque)) else (), maxlen=maxlen)
+
+    def get_bounded_history(self, user_id: int, key: str) -> deque:
+        """Возвращает ограниченную историю пользователя (живую ссылку на deque)."""
+        user = self._peek_user(user_id) or self._get_user(user_id)
+        history = user.get(key)
+        if not isinstance(history, deque):
+            self._wrap_histories(user)
+            history = user[key]
+        return history
+
+    def _peek_user(self, user_id: int) -> Dict[str, Any] | None:
+        """
+        Возвращает запись пользователя без создания и без обновления last_activity.
+
+        Для чтения и служебных записей (рассылки, кэши): активностью считается только
+        действие пользователя — его отмечают обработчики через get_user.
+        """
+        return self.data.get(str(user_id))
 
     def _get_user(self, user_id: int) -> Dict[str, Any]:
         uid = str(user_id)
-        if uid not in self.data:
-            self.data[uid] = self._create_new_user()
-        user = self.data[uid]
-        user["last_activity"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        user = self.data.get(uid)
+        if user is None:
+            user = self.data[uid] = self._create_new_user()
+            self._sync_notifications_index(uid, user)
+        user["last_activity"] = format_datetime_iso()
 
         if is_admin(user_id):
             admin_mode = user.get("admin_mode")
@@ -162,7 +243,7 @@ class UserStorage:
         return user
 
     def _create_new_user(self) -> Dict[str, Any]:
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now = format_datetime_iso()
         return {
             "birth_date": None,
             "birth_time": None,
@@ -190,8 +271,8 @@ class UserStorage:
                 "birth_date": None,
             },
             "notifications": {"enabled": True, "time": config.NOTIFICATION_TIME},
-            "text_history": [],
-            "affirmation_history": [],
+            "text_cursors": {},
+            "affirmation_history": deque(maxlen=BOUNDED_HISTORIES["affirmation_history"]),
             "last_daily_notification": None,
             "daily_number": {
                 "date": None,
@@ -229,58 +310,75 @@ class UserStorage:
     def get_user(self, user_id: int) -> Dict[str, Any]:
         return self._get_user(user_id)
 
+    def get_user_readonly(self, user_id: int) -> Dict[str, Any] | None:
+        """Запись пользователя для проверок: None, если ее нет; ничего не создает и не меняет."""
+        return self._peek_user(user_id)
+
     def update_user(self, user_id: int, **kwargs):
         user = self._get_user(user_id)
         user.update(kwargs)
+        if "notifications" in kwargs:
+            self._sync_notifications_index(str(user_id), user)
         self._save_data()
 
     def get_today_diary_count(self, user_id: int) -> int:
         user = self.get_user(user_id)
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = format_today_iso()
         observations = user.get("diary_observations", [])
         return sum(1 for obs in observations if obs["date"].startswith(today))
 
-    def _update_daily_cache_if_needed(self, user_id: int):
-        """Сбрасывает дневные лимиты и кэш, если наступил новый день"""
-        user = self._get_user(user_id)
+    def _update_daily_cache_if_needed(self, user: Dict[str, Any]) -> bool:
+        """
+        Сбрасывает дневные лимиты и кэш, если наступил новый день.
+
+        Принимает уже полученную запись пользователя; возвращает True, если был сброс
+        (сохранение при этом только планируется, как и для остальных изменений).
+        """
         usage = user["usage_stats"]
-        today = datetime.now().strftime("%Y-%m-%d")
-        if usage["last_reset"] != today:
-            usage["daily_requests"] = 0
-            usage["compatibility_checks"] = 0
-            usage["repeat_views"] = 0
-            usage["requests"] = 0
-            usage["last_reset"] = today
-            user["daily_cache"] = {
-                "date": None,
-                "life_path_result": None,
-                "soul_number_result": None,
-                "daily_number_result": None,
-                "birth_date": None,
-            }
-            # Сбрасываем кэш Таро для дневных раскладов
-            if "tarot_cache" in user:
-                for spread_key in ["single_card", "daily_three"]:
-                    if spread_key in user["tarot_cache"]:
-                        cache = user["tarot_cache"][spread_key]
-                        if cache.get("date") != today:
-                            user["tarot_cache"][spread_key] = {"date": None, "cards": None, "interpretations": None}
-            user["repeat_views"] = 0
-            self._save_data()
+        today = format_today_iso()
+        if usage["last_reset"] == today:
+            return False
+        usage["daily_requests"] = 0
+        usage["compatibility_checks"] = 0
+        usage["repeat_views"] = 0
+        usage["requests"] = 0
+        usage["last_reset"] = today
+        user["daily_cache"] = {
+            "date": None,
+            "life_path_result": None,
+            "soul_number_result": None,
+            "daily_number_result": None,
+            "birth_date": None,
+        }
+        # Сбрасываем кэш Таро для дневных раскладов
+        if "tarot_cache" in user:
+            for spread_key in ["single_card", "daily_three"]:
+                if spread_key in user["tarot_cache"]:
+                    cache = user["tarot_cache"][spread_key]
+                    if cache.get("date") != today:
+                        user["tarot_cache"][spread_key] = {"date": None, "cards": None, "interpretations": None}
+        user["repeat_views"] = 0
+        self._save_data()
+        return True
 
     # -------------------------
     # Дополнительно: методы для дневника
     # -------------------------
 
-    def add_diary_observation(self, user_id: int, text: str, number: str):
+    def add_diary_observation(
+        self, user_id: int, text: str, number: Any, category: str = "Без темы"
+    ) -> Dict[str, Any]:
+        """Добавляет запись в дневник и планирует отложенное сохранение."""
         user = self.get_user(user_id)
         observation = {
             "text": text,
+            "date": format_datetime_iso(),
             "number": number,
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "category": category,
         }
         user.setdefault("diary_observations", []).append(observation)
         self._save_data()
+        return observation
 
     # -------------------------
     # Ограничения и лимиты
@@ -288,11 +386,15 @@ class UserStorage:
 
     def get_usage_stats(self, user_id: int) -> dict:
         user = self.get_user(user_id)
-        return user.get("usage_stats", {})
+        if "usage_stats" not in user:
+            return {}
+        # Вчерашние счетчики не показываем: сброс тот же, что и при проверке лимитов
+        self._update_daily_cache_if_needed(user)
+        return user["usage_stats"]
 
     def can_make_request(self, user_id: int) -> bool:
-        self._update_daily_cache_if_needed(user_id)
         user = self._get_user(user_id)
+        self._update_daily_cache_if_needed(user)
 
         if user["subscription"]["active"]:
             user["usage_stats"]["daily_requests"] += 1
@@ -310,16 +412,16 @@ class UserStorage:
         return True
 
     def can_check_compatibility(self, user_id: int) -> bool:
-        self._update_daily_cache_if_needed(user_id)
         user = self._get_user(user_id)
+        self._update_daily_cache_if_needed(user)
         if user["subscription"]["active"]:
             return True
         limit = config.FREE_COMPATIBILITY_LIMIT
         return user["usage_stats"]["compatibility_checks"] < limit
 
     def increment_usage(self, user_id: int, request_type: str = "daily"):
-        self._update_daily_cache_if_needed(user_id)
         user = self._get_user(user_id)
+        self._update_daily_cache_if_needed(user)
         if request_type == "daily":
             user["usage_stats"]["daily_requests"] += 1
         elif request_type == "compatibility":
@@ -327,8 +429,8 @@ class UserStorage:
         self._save_data()
 
     def can_view_cached_result(self, user_id: int) -> bool:
-        self._update_daily_cache_if_needed(user_id)
         user = self.get_user(user_id)
+        self._update_daily_cache_if_needed(user)
 
         if user["subscription"]["active"]:
             return True
@@ -337,8 +439,8 @@ class UserStorage:
         return user["usage_stats"].get("repeat_views", 0) < limit
 
     def increment_repeat_view(self, user_id: int):
-        self._update_daily_cache_if_needed(user_id)
         user = self.get_user(user_id)
+        self._update_daily_cache_if_needed(user)
         usage = user["usage_stats"]
         usage["repeat_views"] = usage.get("repeat_views", 0) + 1
         self._save_data()
@@ -369,7 +471,7 @@ class UserStorage:
         self._save_data()
 
     def get_cached_result(self, user_id: int) -> dict | None:
-        user = self.get_user(user_id)
+        user = self._peek_user(user_id) or {}
         results = user.get("daily_results", [])
         if results:
             return results[-1]  # возвращаем последний результат
@@ -379,19 +481,16 @@ class UserStorage:
     # Истории
     # -------------------------
 
-    def add_text_to_history(self, user_id: int, text: str):
-        user = self.get_user(user_id)
-        user.setdefault("text_history", []).append(text)
-        self._save_data()
-
-    def get_text_history(self, user_id: int) -> list:
-        user = self.get_user(user_id)
-        return user.get("text_history", [])
+    def get_text_cursor(self, user_id: int, number: int, context: str) -> list:
+        """
+        Возвращает перемешанные индексы еще не показанных текстов для числа и
+        контекста (живую ссылку на список; после изменения вызвать _save_data).
+        """
+        user = self._peek_user(user_id) or self._get_user(user_id)
+        return user.setdefault("text_cursors", {}).setdefault(f"{number}:{context}", [])
 
     def add_affirmation_to_history(self, user_id: int, text: str):
-        user = self._get_user(user_id)
-        user.setdefault("affirmation_history", []).append(text)
-        user["affirmation_history"] = user["affirmation_history"][-10:]
+        self.get_bounded_history(user_id, "affirmation_history").append(text)
         self._save_data()
 
     # -------------------------
@@ -427,6 +526,7 @@ class UserStorage:
         notifications["time"] = target_time
         if enabled:
             user["last_daily_notification"] = None
+        self._sync_notifications_index(str(user_id), user)
         self._save_data()
 
     def cleanup_old_data(self, days: int = 30) -> int:
@@ -436,25 +536,34 @@ class UserStorage:
         :param days: Количество дней неактивности
         :return: Количество удаленных пользователей
         """
-        from datetime import datetime, timedelta
+        from datetime import timedelta
 
         cutoff_date = datetime.now() - timedelta(days=days)
+        # last_activity пишется как "YYYY-MM-DD HH:MM:SS" — такие строки
+        # сравниваются как даты без разбора
+        cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
         users_to_delete = []
 
         for user_id, user_data in self.data.items():
             last_activity = user_data.get("last_activity")
-            if last_activity:
-                try:
-                    activity_date = datetime.strptime(last_activity, "%Y-%m-%d %H:%M:%S")
-                    if activity_date < cutoff_date:
-                        users_to_delete.append(user_id)
-                except ValueError:
-                    # Если формат даты неверный, пропускаем
-                    continue
+            if not last_activity or not isinstance(last_activity, str):
+                continue
+            if len(last_activity) == 19 and last_activity[10] == " ":
+                if last_activity < cutoff_str:
+                    users_to_delete.append(user_id)
+                continue
+            try:
+                # Записи в другом ISO-формате разбираем как раньше
+                if datetime.fromisoformat(last_activity) < cutoff_date:
+                    users_to_delete.append(user_id)
+            except ValueError:
+                # Если формат даты неверный, пропускаем
+                continue
 
         # Удаляем пользователей
         for user_id in users_to_delete:
             del self.data[user_id]
+            self._notifications_enabled.discard(user_id)
 
         if users_to_delete:
             self._save_data(immediate=True)  # Критичное сохранение при очистке
@@ -471,8 +580,8 @@ class UserStorage:
         return user.setdefault("retro_alerts", {})
 
     def has_retro_alert(self, user_id: int, planet: str, alert_type: str, date_str: str) -> bool:
-        state = self.get_retro_alert_state(user_id)
-        planet_state = state.get(planet, {})
+        user = self._peek_user(user_id) or {}
+        planet_state = user.get("retro_alerts", {}).get(planet, {})
         key = "last_pre_alert" if alert_type == "pre" else "last_start_alert"
         return planet_state.get(key) == date_str
 
@@ -487,7 +596,7 @@ class UserStorage:
         self._save_data()
 
     def get_diary_entries_in_range(self, user_id: int, start: datetime, end: datetime) -> list[dict[str, Any]]:
-        user = self.get_user(user_id)
+        user = self._peek_user(user_id) or {}
         entries = user.get("diary_observations", [])
         result = []
         for entry in entries:
@@ -495,7 +604,7 @@ class UserStorage:
             if not date_str:
                 continue
             try:
-                entry_datetime = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+                entry_datetime = datetime.fromisoformat(date_str)
             except ValueError:
                 continue
             if start <= entry_datetime <= end:
@@ -506,10 +615,24 @@ class UserStorage:
     # Уведомления
     # -------------------------
 
+    def _sync_notifications_index(self, uid: str, user: Dict[str, Any]) -> None:
+        if user.get("notifications", {}).get("enabled", False):
+            self._notifications_enabled.add(uid)
+        else:
+            self._notifications_enabled.discard(uid)
+
     def get_users_with_notifications(self) -> list[dict[str, Any]]:
-        """Возвращает пользователей с включёнными уведомлениями."""
+        """
+        Возвращает пользователей с включёнными уведомлениями.
+
+        Обходит только индекс включивших уведомления, а не всех пользователей;
+        флаг перепроверяется на случай, если запись изменили в обход методов.
+        """
         users: list[dict[str, Any]] = []
-        for user_id, user_data in self.data.items():
+        for user_id in self._notifications_enabled:
+            user_data = self.data.get(user_id)
+            if user_data is None:
+                continue
             notifications = user_data.get("notifications", {})
             if notifications.get("enabled", False):
                 users.append({"user_id": int(user_id), **user_data})
@@ -517,24 +640,24 @@ class UserStorage:
 
     def can_send_daily_notification(self, user_id: int) -> bool:
         """Проверяет, отправляли ли уведомление пользователю сегодня."""
-        user = self.get_user(user_id)
-        today = datetime.now().strftime("%Y-%m-%d")
+        user = self._peek_user(user_id) or {}
+        today = format_today_iso()
         last_sent = user.get("last_daily_notification")
         return last_sent != today
 
     def mark_daily_notification_sent(self, user_id: int):
         """Отмечает, что уведомление пользователю уже отправлено сегодня."""
-        user = self.get_user(user_id)
-        user["last_daily_notification"] = datetime.now().strftime("%Y-%m-%d")
+        user = self._peek_user(user_id) or self._get_user(user_id)
+        user["last_daily_notification"] = format_today_iso()
         self._save_data()
 
     def get_daily_number_cache(self, user_id: int) -> dict[str, Any]:
-        user = self.get_user(user_id)
+        user = self._peek_user(user_id) or {}
         return user.get("daily_number", {})
 
     def get_tarot_cache(self, user_id: int, spread_key: str) -> dict[str, Any] | None:
         """Получает кэш расклада Таро для пользователя."""
-        user = self._get_user(user_id)
+        user = self._peek_user(user_id) or {}
         tarot_cache = user.get("tarot_cache", {})
         return tarot_cache.get(spread_key)
 
@@ -556,7 +679,7 @@ class UserStorage:
             user["tarot_history"] = []
         
         reading = {
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date": format_datetime_iso(),
             "spread_key": spread_key,
             "question": question,
             "cards": cards,
@@ -596,7 +719,7 @@ class UserStorage:
         """
         user = self._get_user(user_id)
         achievements = user.setdefault("achievements", {})
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = format_today_iso()
         last_date = achievements.get("last_activity_date")
         
         # Если уже обновляли сегодня, возвращаем текущий стрик
@@ -607,8 +730,8 @@ class UserStorage:
         
         if last_date:
             try:
-                last_dt = datetime.strptime(last_date, "%Y-%m-%d")
-                today_dt = datetime.strptime(today, "%Y-%m-%d")
+                last_dt = date.fromisoformat(last_date)
+                today_dt = date.fromisoformat(today)
                 days_diff = (today_dt - last_dt).days
                 
                 if days_diff == 1:
@@ -720,7 +843,7 @@ class UserStorage:
         challenges["current"] = {
             "id": challenge_id,
             **challenge_data,
-            "date": datetime.now().strftime("%Y-%m-%d"),
+            "date": format_today_iso(),
         }
         self._save_data()
     
@@ -734,7 +857,7 @@ class UserStorage:
         user = self._get_user(user_id)
         challenges = user.setdefault("daily_challenges", {})
         current = challenges.get("current")
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = format_today_iso()
         
         if not current:
             return False
@@ -761,8 +884,8 @@ class UserStorage:
             pass
         elif last_challenge_date:
             try:
-                last_dt = datetime.strptime(last_challenge_date, "%Y-%m-%d")
-                today_dt = datetime.strptime(today, "%Y-%m-%d")
+                last_dt = date.fromisoformat(last_challenge_date)
+                today_dt = date.fromisoformat(today)
                 days_diff = (today_dt - last_dt).days
                 
                 if days_diff == 1:
@@ -2,48 +2,127 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import pickle
 import random
 from pathlib import Path
 
+from .json_utils import load_file
 from .storage import user_storage
 
 logger = logging.getLogger(__name__)
 
 NUMBERS_FILE = Path(__file__).resolve().parent.parent.parent / "numbers.json"
-_number_texts_cache: dict[str, dict] | None = None
+# Скомпилированная копия numbers.json; пересобирается, когда меняется исходный файл
+NUMBERS_CACHE_FILE = NUMBERS_FILE.with_suffix(".pkl")
 
 
-def get_number_texts() -> dict[str, dict]:
-    global _number_texts_cache
-    if _number_texts_cache is None:
-        try:
-            with open(NUMBERS_FILE, "r", encoding="utf-8") as f:
-                _number_texts_cache = json.load(f)
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Ошибка при загрузке numbers.json: %s", exc)
-            _number_texts_cache = {}
-    return _number_texts_cache
+def _read_numbers_cache(stamp: tuple[int, int]) -> dict[int, dict[str, tuple[str, ...]]] | None:
+    """Возвращает данные из кэша, если он собран из текущей версии numbers.json."""
+    try:
+        with open(NUMBERS_CACHE_FILE, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Кэш numbers.pkl поврежден, пересобираем: %s", exc)
+        return None
+    return data if cached_stamp == stamp else None
 
 
-def get_text(number: int, context: str, user_id: int) -> str:
+def _write_numbers_cache(stamp: tuple[int, int], data: dict) -> None:
+    tmp_path = NUMBERS_CACHE_FILE.with_suffix(".pkl.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=5)
+        os.replace(tmp_path, NUMBERS_CACHE_FILE)
+    except OSError as exc:
+        # Кэш — только ускорение, без него работаем с JSON
+        logger.warning("Не удалось записать numbers.pkl: %s", exc)
+
+
+def _load_number_texts() -> dict[int, dict[str, tuple[str, ...]]]:
+    """Читает numbers.json и замораживает варианты в кортежи с int-ключами."""
     try:
-        number_texts = get_number_texts()
-        if str(number) not in number_texts or context not in number_texts[str(number)]:
-            return "Информация временно недоступна."
-
-        options = number_texts[str(number)][context]
-        shown = user_storage.get_text_history(user_id)
-        unused = [text for text in options if text not in shown]
-        if not unused:
-            unused = options
-            user_storage.update_user(user_id, text_history=[])
-
-        chosen = random.choice(unused)
-        user_storage.add_text_to_history(user_id, chosen)
-        return chosen
+        stat = NUMBERS_FILE.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _read_numbers_cache(stamp)
+        if cached is not None:
+            return cached
+        raw = load_file(NUMBERS_FILE)
     except Exception as exc:  # noqa: BLE001
-        logger.error("Ошибка при получении текста: %s", exc)
-        return "Произошла ошибка. Попробуйте позже."
+        logger.error("Ошибка при загрузке numbers.json: %s", exc)
+        return {}
+    data = {
+        int(number): {context: tuple(options) for context, options in contexts.items()}
+        for number, contexts in raw.items()
+    }
+    _write_numbers_cache(stamp, data)
+    return data
+
+
+# Тексты чисел загружаются один раз при импорте: {число: {контекст: (варианты, ...)}}
+NUMBER_TEXTS: dict[int, dict[str, tuple[str, ...]]] = _load_number_texts()
+
+# Плоский индекс для горячего пути: (число, контекст) -> варианты; пустые списки не попадают
+OPTIONS: dict[tuple[int, str], tuple[str, ...]] = {
+    (number, context): options
+    for number, contexts in NUMBER_TEXTS.items()
+    for context, options in contexts.items()
+    if options
+}
+HAS_NUMBER: frozenset[int] = frozenset(number for number, _ in OPTIONS)
+
+
+def peek_text(number: int, context: str, user_id: int) -> str | None:
+    """
+    Возвращает следующий еще не показанный пользователю текст для числа и
+    контекста, не сдвигая курсор (сдвигает advance_text). None, если текстов нет.
+    """
+    options = OPTIONS.get((number, context))
+    if not options:
+        return None
+
+    # Перестановка индексов (Fisher-Yates): берем с конца, пока не кончится
+    cursor = user_storage.get_text_cursor(user_id, number, context)
+    if not cursor or cursor[-1] >= len(options):
+        # Все варианты показаны (или numbers.json изменился) — новый круг
+        cursor[:] = range(len(options))
+        random.shuffle(cursor)
+        user_storage._save_data()
+    return options[cursor[-1]]
+
+
+def advance_text(number: int, context: str, user_id: int) -> None:
+    """Отмечает текст, который вернул peek_text, как показанный."""
+    if (number, context) not in OPTIONS:
+        return
+    cursor = user_storage.get_text_cursor(user_id, number, context)
+    if cursor:
+        cursor.pop()
+        user_storage._save_data()
+
+
+def pick_text(number: int, context: str, user_id: int) -> str | None:
+    """
+    Берет следующий еще не показанный пользователю текст для числа и контекста.
+    Возвращает None, если текстов нет.
+    """
+    chosen = peek_text(number, context, user_id)
+    if chosen is not None:
+        advance_text(number, context, user_id)
+    return chosen
+
+
+def get_text(number: int, context: str, user_id: int) -> str:
+    """
+    Выбирает еще не показанный пользователю текст для числа и контекста.
 
+    Ошибки хранилища не перехватываются — их обрабатывает catch_errors хендлера.
+    """
+    chosen = pick_text(number, context, user_id)
+    if chosen is None:
+        logger.warning("Нет текстов для числа %s в контексте %s", number, context)
+        return "Информация временно недоступна."
+    return chosen